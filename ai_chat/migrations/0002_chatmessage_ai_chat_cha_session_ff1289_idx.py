@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chat', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['session', 'created_at'], name='ai_chat_cha_session_ff1289_idx'),
+        ),
+    ]
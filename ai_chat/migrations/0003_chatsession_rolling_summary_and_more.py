@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chat', '0002_chatmessage_ai_chat_cha_session_ff1289_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatsession',
+            name='rolling_summary',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='chatsession',
+            name='summary_message_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations, models
+
+
+def copy_role_forward(apps, schema_editor):
+    ChatMessage = apps.get_model('ai_chat', 'ChatMessage')
+    ChatMessage.objects.filter(role='user').update(role_int=1)
+    ChatMessage.objects.exclude(role='user').update(role_int=2)
+
+
+def copy_role_backward(apps, schema_editor):
+    ChatMessage = apps.get_model('ai_chat', 'ChatMessage')
+    ChatMessage.objects.filter(role_int=1).update(role='user')
+    ChatMessage.objects.exclude(role_int=1).update(role='assistant')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chat', '0003_chatsession_rolling_summary_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatmessage',
+            name='role_int',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.RunPython(copy_role_forward, copy_role_backward),
+        migrations.RemoveField(
+            model_name='chatmessage',
+            name='role',
+        ),
+        migrations.RenameField(
+            model_name='chatmessage',
+            old_name='role_int',
+            new_name='role',
+        ),
+        migrations.AlterField(
+            model_name='chatmessage',
+            name='role',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'user'), (2, 'assistant')]),
+        ),
+    ]
@@ -9,6 +9,8 @@ class ChatSession(models.Model):
         related_name='chat_sessions'
     )
     title = models.CharField(max_length=100, default='새 대화')
+    rolling_summary = models.TextField(blank=True, default='')
+    summary_message_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -17,19 +19,22 @@ class ChatSession(models.Model):
 
 
 class ChatMessage(models.Model):
-    ROLE_CHOICES = [
-        ('user', '사용자'),
-        ('assistant', 'AI'),
-    ]
+    class Role(models.IntegerChoices):
+        # 문자열 대신 smallint로 저장 (행 크기 축소 + 정수 비교)
+        USER = 1, 'user'
+        ASSISTANT = 2, 'assistant'
 
     session = models.ForeignKey(
         ChatSession,
         on_delete=models.CASCADE,
         related_name='messages'
     )
-    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    role = models.PositiveSmallIntegerField(choices=Role.choices)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ['created_at']
\ No newline at end of file
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['session', 'created_at']),
+        ]
\ No newline at end of file
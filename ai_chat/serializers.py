@@ -3,6 +3,9 @@ from ai_chat.models import ChatSession, ChatMessage
 
 
 class ChatMessageSerializer(serializers.ModelSerializer):
+    # 저장은 smallint, API 응답은 기존과 동일한 'user'/'assistant' 문자열
+    role = serializers.CharField(source='get_role_display', read_only=True)
+
     class Meta:
         model = ChatMessage
         fields = ('id', 'role', 'content', 'created_at')
@@ -24,8 +27,9 @@ class ChatSessionListSerializer(serializers.ModelSerializer):
         fields = ('id', 'title', 'last_message', 'updated_at')
 
     def get_last_message(self, obj):
-        last = obj.messages.last()
-        return last.content[:50] if last else None
+        # 뷰에서 Subquery로 annotate한 값 사용 (세션당 추가 쿼리 방지)
+        content = getattr(obj, 'last_message_content', None)
+        return content[:50] if content else None
 
 
 class ChatRequestSerializer(serializers.Serializer):
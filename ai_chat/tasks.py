@@ -0,0 +1,34 @@
+import logging
+
+from celery import shared_task
+
+from .models import ChatSession, ChatMessage
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def generate_reply(session_id, user_message):
+    """Gemini 응답 생성을 워커에서 수행하고 결과를 메시지로 저장"""
+    # 순환 임포트 방지를 위해 함수 내부에서 임포트
+    from .views import ERROR_MESSAGE, _MODEL, _build_history, _refresh_rolling_summary
+
+    session = ChatSession.objects.select_related('user').get(id=session_id)
+
+    # 오래된 히스토리는 요약으로 압축한 뒤, 요약 + 최근 대화만 전달
+    _refresh_rolling_summary(session)
+    history = _build_history(session)
+
+    try:
+        chat = _MODEL.start_chat(history=history)
+        response = chat.send_message(user_message)
+        ai_response = response.text
+    except Exception:
+        ai_response = ERROR_MESSAGE
+        logger.exception("Gemini API Error")
+
+    # AI 응답 저장 (bulk_create로 단일 배치 INSERT)
+    ai_message = ChatMessage.objects.bulk_create([
+        ChatMessage(session=session, role=ChatMessage.Role.ASSISTANT, content=ai_response)
+    ])[0]
+    return ai_message.id
@@ -1,8 +1,9 @@
 from django.urls import path
-from .views import ChatSessionListView, ChatSessionDetailView, ChatMessageView
+from .views import ChatSessionListView, ChatSessionDetailView, ChatMessageView, ChatMessageStreamView
 
 urlpatterns = [
     path('sessions/', ChatSessionListView.as_view(), name='chat-session-list'),
     path('sessions/<int:session_id>/', ChatSessionDetailView.as_view(), name='chat-session-detail'),
     path('send/', ChatMessageView.as_view(), name='chat-send'),
+    path('send/stream/', ChatMessageStreamView.as_view(), name='chat-send-stream'),
 ]
\ No newline at end of file
@@ -1,5 +1,11 @@
+import logging
+
 import google.generativeai as genai
 from django.conf import settings
+from django.db import transaction
+from django.db.models import OuterRef, Prefetch, Subquery
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -7,15 +13,17 @@ from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
 from .models import ChatSession, ChatMessage
+from .tasks import generate_reply
 from .serializers import (
     ChatSessionSerializer,
     ChatSessionListSerializer,
     ChatRequestSerializer,
-    ChatMessageSerializer,
 )
 
-# Gemini 설정
-genai.configure(api_key=settings.GEMINI_API_KEY)
+logger = logging.getLogger(__name__)
+
+# Gemini 설정 (gRPC 채널을 프로세스 수명 동안 재사용해 호출마다 TLS 핸드셰이크 방지)
+genai.configure(api_key=settings.GEMINI_API_KEY, transport='grpc')
 
 SYSTEM_PROMPT = """당신은 친절하고 전문적인 여행 플래너 AI입니다.
 
@@ -51,6 +59,84 @@ SYSTEM_PROMPT = """당신은 친절하고 전문적인 여행 플래너 AI입니
 - 여행과 관련없는 질문은 정중히 여행 관련 대화로 유도
 """
 
+ERROR_MESSAGE = "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+
+# 모델명과 시스템 프롬프트는 상수이므로 요청마다 만들지 않고 모듈 로드 시 한 번만 생성
+_MODEL = genai.GenerativeModel(
+    model_name='gemini-2.5-flash',
+    system_instruction=SYSTEM_PROMPT
+)
+
+
+def _get_or_create_session(user, session_id, user_message):
+    """session_id가 있으면 해당 세션 조회(없으면 404), 없으면 메시지 내용으로 새 세션 생성"""
+    if session_id:
+        return get_object_or_404(
+            ChatSession.objects.select_related('user'), id=session_id, user=user
+        )
+    title = user_message[:30] + '...' if len(user_message) > 30 else user_message
+    # bulk_create는 PostgreSQL에서 RETURNING으로 pk를 돌려주므로 create와 동일하게 사용 가능
+    return ChatSession.objects.bulk_create([ChatSession(user=user, title=title)])[0]
+
+
+# 매 턴 Gemini에 전달하는 최근 히스토리 개수 (이보다 오래된 내용은 요약으로 압축)
+HISTORY_LIMIT = 20
+
+# ChatMessage.role → Gemini 히스토리 role 매핑
+_ROLE_MAP = {ChatMessage.Role.USER: 'user', ChatMessage.Role.ASSISTANT: 'model'}
+
+
+def _refresh_rolling_summary(session):
+    """히스토리가 HISTORY_LIMIT를 넘으면 오래된 구간을 요약해 세션에 저장
+
+    이미 요약된 구간(summary_message_count)은 다시 요약하지 않고,
+    기존 요약에 새로 밀려난 메시지만 합쳐 갱신합니다.
+    """
+    total = session.messages.count()
+    overflow = total - HISTORY_LIMIT
+    if overflow <= session.summary_message_count:
+        return
+
+    older = session.messages.order_by('created_at').values(
+        'role', 'content'
+    )[session.summary_message_count:overflow]
+    transcript = '\n'.join(
+        f"[{ChatMessage.Role(m['role']).label}] {m['content']}" for m in older
+    )
+
+    prompt = "다음 여행 상담 대화를 핵심 정보(여행지, 일정, 예산, 사용자의 선호) 위주로 간결하게 요약해주세요.\n\n"
+    if session.rolling_summary:
+        prompt += f"기존 요약:\n{session.rolling_summary}\n\n추가된 대화:\n{transcript}"
+    else:
+        prompt += f"대화:\n{transcript}"
+
+    try:
+        response = _MODEL.generate_content(prompt)
+        session.rolling_summary = response.text
+        session.summary_message_count = overflow
+        session.save(update_fields=['rolling_summary', 'summary_message_count', 'updated_at'])
+    except Exception:
+        # 요약 실패 시 이번 턴은 기존 요약으로 진행
+        logger.exception("Gemini API Error")
+
+
+def _build_history(session, limit=HISTORY_LIMIT):
+    """Gemini용 대화 히스토리 구성 (요약 + 최근 limit개, 현재 메시지 제외)"""
+    previous_messages = list(
+        session.messages.order_by('-created_at').values('role', 'content')[:limit]
+    )[::-1]
+    history = []
+    if session.rolling_summary:
+        history.append({
+            'role': 'user',
+            'parts': [f"이전 대화 요약:\n{session.rolling_summary}"]
+        })
+    history += [
+        {'role': _ROLE_MAP.get(msg['role'], 'model'), 'parts': [msg['content']]}
+        for msg in previous_messages[:-1]
+    ]
+    return history
+
 
 class ChatSessionListView(APIView):
     """채팅 세션 목록 조회 / 생성"""
@@ -66,7 +152,17 @@ class ChatSessionListView(APIView):
         }
     )
     def get(self, request):
-        sessions = ChatSession.objects.filter(user=request.user)
+        # 세션별 마지막 메시지를 서브쿼리로 한 번에 조회 (세션당 추가 쿼리 방지)
+        last_message = ChatMessage.objects.filter(
+            session=OuterRef('pk')
+        ).order_by('-created_at').values('content')[:1]
+
+        # 목록 직렬화에 필요한 컬럼만 조회 (rolling_summary 같은 TextField 제외)
+        sessions = ChatSession.objects.filter(user=request.user).only(
+            'id', 'title', 'updated_at'
+        ).annotate(
+            last_message_content=Subquery(last_message)
+        )
         serializer = ChatSessionListSerializer(sessions, many=True)
         return Response(serializer.data)
 
@@ -105,10 +201,17 @@ class ChatSessionDetailView(APIView):
     )
     def get(self, request, session_id):
         try:
-            session = ChatSession.objects.get(id=session_id, user=request.user)
+            session = ChatSession.objects.select_related('user').prefetch_related(
+                Prefetch(
+                    'messages',
+                    queryset=ChatMessage.objects.order_by('created_at').only(
+                        'id', 'role', 'content', 'created_at', 'session_id'
+                    ),
+                )
+            ).get(id=session_id, user=request.user)
         except ChatSession.DoesNotExist:
             return Response({'error': '세션을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
-        
+
         serializer = ChatSessionSerializer(session)
         return Response(serializer.data)
 
@@ -124,7 +227,7 @@ class ChatSessionDetailView(APIView):
     )
     def delete(self, request, session_id):
         try:
-            session = ChatSession.objects.get(id=session_id, user=request.user)
+            session = ChatSession.objects.select_related('user').get(id=session_id, user=request.user)
         except ChatSession.DoesNotExist:
             return Response({'error': '세션을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -139,22 +242,17 @@ class ChatMessageView(APIView):
     @extend_schema(
         tags=['AI Chat_send_POST'],
         summary='AI에게 메시지 전송',
-        description='AI 여행 플래너에게 메시지를 보내고 응답을 받습니다. session_id가 없으면 새 세션이 자동 생성됩니다.',
+        description=(
+            'AI 여행 플래너에게 메시지를 보냅니다. session_id가 없으면 새 세션이 자동 생성됩니다. '
+            '응답 생성은 백그라운드 워커에서 처리되며, 완료된 응답은 세션 상세 조회로 확인합니다.'
+        ),
         request=ChatRequestSerializer,
         responses={
-            200: {
+            202: {
                 'type': 'object',
                 'properties': {
                     'session_id': {'type': 'integer', 'example': 1},
-                    'message': {
-                        'type': 'object',
-                        'properties': {
-                            'id': {'type': 'integer', 'example': 1},
-                            'role': {'type': 'string', 'example': 'assistant'},
-                            'content': {'type': 'string', 'example': '📅 강릉 2박 3일 여행 일정...'},
-                            'created_at': {'type': 'string', 'example': '2025-12-10T10:00:00Z'},
-                        }
-                    }
+                    'task_id': {'type': 'string', 'example': 'b7e2c7f0-5c1e-4d8a-9a0f-1c2d3e4f5a6b'},
                 }
             },
             401: OpenApiResponse(description='인증 실패'),
@@ -168,53 +266,82 @@ class ChatMessageView(APIView):
         user_message = serializer.validated_data['message']
         session_id = serializer.validated_data.get('session_id')
 
-        # 세션 가져오기 또는 생성
-        if session_id:
+        # 세션 조회/생성과 사용자 메시지 저장을 한 트랜잭션(한 번의 커밋)으로 처리
+        with transaction.atomic():
+            session = _get_or_create_session(request.user, session_id, user_message)
+            ChatMessage.objects.bulk_create([
+                ChatMessage(session=session, role=ChatMessage.Role.USER, content=user_message)
+            ])
+
+        # Gemini 생성은 Celery 워커로 넘기고 즉시 응답 (요청 스레드 점유 방지)
+        task = generate_reply.delay(session.id, user_message)
+
+        return Response(
+            {'session_id': session.id, 'task_id': task.id},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class ChatMessageStreamView(APIView):
+    """AI 채팅 메시지 전송 (스트리밍)"""
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        tags=['AI Chat_send_POST'],
+        summary='AI에게 메시지 전송 (스트리밍)',
+        description=(
+            'AI 여행 플래너에게 메시지를 보내고 응답을 스트리밍으로 받습니다. '
+            '생성되는 텍스트 조각이 도착하는 대로 전송되며, 완료 시 전체 응답이 메시지로 저장됩니다. '
+            '생성된 세션 ID는 X-Session-Id 응답 헤더로 전달됩니다.'
+        ),
+        request=ChatRequestSerializer,
+        responses={
+            200: OpenApiResponse(description='text/event-stream 형식의 응답 스트림'),
+            401: OpenApiResponse(description='인증 실패'),
+            404: OpenApiResponse(description='세션을 찾을 수 없음'),
+        }
+    )
+    def post(self, request):
+        serializer = ChatRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user_message = serializer.validated_data['message']
+        session_id = serializer.validated_data.get('session_id')
+
+        # 세션 조회/생성과 사용자 메시지 저장을 한 트랜잭션(한 번의 커밋)으로 처리
+        with transaction.atomic():
+            session = _get_or_create_session(request.user, session_id, user_message)
+            ChatMessage.objects.bulk_create([
+                ChatMessage(session=session, role=ChatMessage.Role.USER, content=user_message)
+            ])
+
+        # 오래된 히스토리는 요약으로 압축한 뒤, 요약 + 최근 대화만 전달
+        _refresh_rolling_summary(session)
+        history = _build_history(session)
+
+        chat = _MODEL.start_chat(history=history)
+
+        def stream():
+            # 청크 단위로 전송하면서 버퍼에 모아 마지막에 메시지로 저장
+            buffer = []
             try:
-                session = ChatSession.objects.get(id=session_id, user=request.user)
-            except ChatSession.DoesNotExist:
-                return Response({'error': '세션을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
-        else:
-            title = user_message[:30] + '...' if len(user_message) > 30 else user_message
-            session = ChatSession.objects.create(user=request.user, title=title)
-
-        # 사용자 메시지 저장
-        ChatMessage.objects.create(session=session, role='user', content=user_message)
-
-        # 이전 대화 내역 (최근 20개)
-        previous_messages = list(session.messages.order_by('created_at'))
-        
-        # Gemini용 대화 히스토리 구성 (현재 메시지 제외)
-        history = []
-        for msg in previous_messages[:-1]:
-            history.append({
-                'role': 'user' if msg.role == 'user' else 'model',
-                'parts': [msg.content]
-            })
-
-        # Gemini API 호출
-        try:
-            model = genai.GenerativeModel(
-                model_name='gemini-2.5-flash',
-                system_instruction=SYSTEM_PROMPT
+                response = chat.send_message(user_message, stream=True)
+                for chunk in response:
+                    if chunk.text:
+                        buffer.append(chunk.text)
+                        yield chunk.text
+            except Exception:
+                logger.exception("Gemini API Error")
+                buffer.append(ERROR_MESSAGE)
+                yield ERROR_MESSAGE
+
+            ChatMessage.objects.create(
+                session=session,
+                role=ChatMessage.Role.ASSISTANT,
+                content=''.join(buffer)
             )
-            
-            chat = model.start_chat(history=history)
-            response = chat.send_message(user_message)
-            ai_response = response.text
-
-        except Exception as e:
-            ai_response = "죄송합니다. 일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
-            print(f"Gemini API Error: {e}")
-
-        # AI 응답 저장
-        ai_message = ChatMessage.objects.create(
-            session=session,
-            role='assistant',
-            content=ai_response
-        )
 
-        return Response({
-            'session_id': session.id,
-            'message': ChatMessageSerializer(ai_message).data,
-        })
\ No newline at end of file
+        streaming_response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+        streaming_response['X-Session-Id'] = str(session.id)
+        streaming_response['Cache-Control'] = 'no-cache'
+        return streaming_response
\ No newline at end of file
@@ -98,7 +98,10 @@ DATABASES = {
         "PASSWORD": env("DB_PASSWORD"),
         "HOST": env("DB_HOST", default="localhost"),
         "PORT": env("DB_PORT", default="5432"),
-        "options": {"client_encoding": "UTF8"},
+        # 요청마다 새 커넥션을 열지 않도록 커넥션 재사용 (초)
+        "CONN_MAX_AGE": 60,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {"client_encoding": "UTF8"},
     }
 }
 
@@ -150,9 +153,12 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES':(
         'rest_framework_simplejwt.authentication.JWTAuthentication',),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
-    'DeFAULT_PERMISSION_CLASSES': [
+    # orjson 렌더러만 사용 (Browsable API 템플릿 비용 제거 + C 레벨 직렬화)
+    'DEFAULT_RENDERER_CLASSES': [
+        'trips.renderers.ORJSONRenderer',
+    ],
+    'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
-        'rest_framework.permissions.AllowAny',
     ],
 }
 
@@ -178,6 +184,22 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# Celery (LLM 호출 등 오래 걸리는 작업을 요청/응답 사이클 밖에서 처리)
+CELERY_BROKER_URL = env.str('CELERY_BROKER_URL', default='redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = env.str('CELERY_RESULT_BACKEND', default='redis://localhost:6379/1')
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TIMEZONE = TIME_ZONE
+
+# 캐시 (여행 합계 등 자주 읽고 드물게 바뀌는 집계 결과 저장)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': env.str('CACHE_URL', default='redis://localhost:6379/2'),
+    }
+}
+
 KAKAO_REST_API_KEY = env.str('KAKAO_REST_API_KEY')
 KAKAO_CLIENT_SECRET = env.str('KAKAO_CLIENT_SECRET')
 KAKAO_REDIRECT_URI = env.str('KAKAO_REDIRECT_URI')
@@ -43,7 +43,7 @@ class TripAdmin(admin.ModelAdmin):
     fieldsets = (
         (None, {"fields": ("user", "title", "description")}),
         ("일정", {"fields": ("start_date", "end_date", "status")}),
-        ("설정", {"fields": ("thumbnail", "is_public")}),
+        ("설정", {"fields": ("thumbnail_asset", "is_public")}),
     )
     
     readonly_fields = ("created_at", "updated_at")
@@ -113,7 +113,7 @@ class ExpenseAdmin(admin.ModelAdmin):
 class TripLogPhotoInline(admin.TabularInline):
     model = TripLogPhoto
     extra = 0
-    fields = ("order", "image_url", "caption")
+    fields = ("order", "image_asset", "caption")
 
 
 @admin.register(TripLog)
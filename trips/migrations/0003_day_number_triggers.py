@@ -0,0 +1,66 @@
+from django.db import migrations
+
+
+EXPENSE_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION trips_expense_set_day_number() RETURNS trigger AS $$
+BEGIN
+    IF NEW.day_number IS NULL AND NEW.expense_date IS NOT NULL THEN
+        SELECT CASE
+            WHEN NEW.expense_date >= t.start_date
+            THEN (NEW.expense_date - t.start_date) + 1
+        END
+        INTO NEW.day_number
+        FROM trips_trip t
+        WHERE t.id = NEW.trip_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trips_expense_day_number_trg
+BEFORE INSERT OR UPDATE ON trips_expense
+FOR EACH ROW EXECUTE FUNCTION trips_expense_set_day_number();
+"""
+
+EXPENSE_TRIGGER_REVERSE_SQL = """
+DROP TRIGGER IF EXISTS trips_expense_day_number_trg ON trips_expense;
+DROP FUNCTION IF EXISTS trips_expense_set_day_number();
+"""
+
+TRIPLOG_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION trips_triplog_set_day_number() RETURNS trigger AS $$
+BEGIN
+    IF NEW.day_number IS NULL AND NEW.visit_date IS NOT NULL THEN
+        SELECT CASE
+            WHEN NEW.visit_date >= t.start_date
+            THEN (NEW.visit_date - t.start_date) + 1
+        END
+        INTO NEW.day_number
+        FROM trips_trip t
+        WHERE t.id = NEW.trip_id;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trips_triplog_day_number_trg
+BEFORE INSERT OR UPDATE ON trips_triplog
+FOR EACH ROW EXECUTE FUNCTION trips_triplog_set_day_number();
+"""
+
+TRIPLOG_TRIGGER_REVERSE_SQL = """
+DROP TRIGGER IF EXISTS trips_triplog_day_number_trg ON trips_triplog;
+DROP FUNCTION IF EXISTS trips_triplog_set_day_number();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0002_alter_trip_thumbnail'),
+    ]
+
+    operations = [
+        migrations.RunSQL(EXPENSE_TRIGGER_SQL, EXPENSE_TRIGGER_REVERSE_SQL),
+        migrations.RunSQL(TRIPLOG_TRIGGER_SQL, TRIPLOG_TRIGGER_REVERSE_SQL),
+    ]
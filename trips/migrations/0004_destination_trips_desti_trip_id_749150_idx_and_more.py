@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0003_day_number_triggers'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='destination',
+            index=models.Index(fields=['trip', 'day', 'order'], name='trips_desti_trip_id_749150_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['trip', 'expense_date', 'expense_time'], name='trips_expen_trip_id_46d415_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['trip', 'category'], name='trips_expen_trip_id_0d9b86_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='triplog',
+            index=models.Index(fields=['trip', 'visit_date', 'visit_time'], name='trips_tripl_trip_id_68a70d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='triplogphoto',
+            index=models.Index(fields=['log', 'order'], name='trips_tripl_log_id_c29cf7_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:46
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0004_destination_trips_desti_trip_id_749150_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='budget',
+            name='amount',
+            field=models.BigIntegerField(validators=[django.core.validators.MinValueValidator(0)], verbose_name='예산 금액'),
+        ),
+        migrations.AlterField(
+            model_name='destination',
+            name='estimated_cost',
+            field=models.BigIntegerField(default=0, validators=[django.core.validators.MinValueValidator(0)], verbose_name='예상 비용'),
+        ),
+        migrations.AlterField(
+            model_name='expense',
+            name='amount',
+            field=models.BigIntegerField(validators=[django.core.validators.MinValueValidator(0)], verbose_name='금액'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0005_alter_budget_amount_alter_destination_estimated_cost_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='destination',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True, verbose_name='위도'),
+        ),
+        migrations.AlterField(
+            model_name='destination',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True, verbose_name='경도'),
+        ),
+        migrations.AlterField(
+            model_name='triplog',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True, verbose_name='위도'),
+        ),
+        migrations.AlterField(
+            model_name='triplog',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True, verbose_name='경도'),
+        ),
+    ]
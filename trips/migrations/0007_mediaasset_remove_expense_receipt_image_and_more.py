@@ -0,0 +1,104 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def intern_urls(apps, schema_editor):
+    """기존 URL 컬럼 값을 MediaAsset으로 중복 제거해 이관"""
+    MediaAsset = apps.get_model('trips', 'MediaAsset')
+    Trip = apps.get_model('trips', 'Trip')
+    Expense = apps.get_model('trips', 'Expense')
+    TripLogPhoto = apps.get_model('trips', 'TripLogPhoto')
+
+    urls = set()
+    for model, column in ((Trip, 'thumbnail'), (Expense, 'receipt_image'), (TripLogPhoto, 'image_url')):
+        urls.update(
+            model.objects.exclude(**{column: ''})
+            .exclude(**{f'{column}__isnull': True})
+            .values_list(column, flat=True)
+            .distinct()
+        )
+    MediaAsset.objects.bulk_create(
+        [MediaAsset(url=url) for url in urls], ignore_conflicts=True
+    )
+    asset_ids = dict(MediaAsset.objects.values_list('url', 'id'))
+
+    for model, column, fk in (
+        (Trip, 'thumbnail', 'thumbnail_asset_id'),
+        (Expense, 'receipt_image', 'receipt_image_asset_id'),
+        (TripLogPhoto, 'image_url', 'image_asset_id'),
+    ):
+        rows = model.objects.exclude(**{column: ''}).exclude(**{f'{column}__isnull': True})
+        objs = []
+        for obj in rows.only('id', column):
+            setattr(obj, fk, asset_ids[getattr(obj, column)])
+            objs.append(obj)
+        model.objects.bulk_update(objs, [fk], batch_size=1000)
+
+
+def restore_urls(apps, schema_editor):
+    Trip = apps.get_model('trips', 'Trip')
+    Expense = apps.get_model('trips', 'Expense')
+    TripLogPhoto = apps.get_model('trips', 'TripLogPhoto')
+
+    for model, column, fk in (
+        (Trip, 'thumbnail', 'thumbnail_asset'),
+        (Expense, 'receipt_image', 'receipt_image_asset'),
+        (TripLogPhoto, 'image_url', 'image_asset'),
+    ):
+        objs = []
+        for obj in model.objects.filter(**{f'{fk}__isnull': False}).select_related(fk):
+            setattr(obj, column, getattr(obj, fk).url)
+            objs.append(obj)
+        model.objects.bulk_update(objs, [column], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0006_alter_destination_latitude_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaAsset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.URLField(max_length=500, unique=True, verbose_name='URL')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '미디어 자산',
+                'verbose_name_plural': '미디어 자산 목록',
+            },
+        ),
+        migrations.AddField(
+            model_name='expense',
+            name='receipt_image_asset',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trips.mediaasset', verbose_name='영수증 이미지'),
+        ),
+        migrations.AddField(
+            model_name='trip',
+            name='thumbnail_asset',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trips.mediaasset', verbose_name='썸네일 이미지'),
+        ),
+        migrations.AddField(
+            model_name='triplogphoto',
+            name='image_asset',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='trips.mediaasset', verbose_name='이미지'),
+        ),
+        migrations.RunPython(intern_urls, restore_urls),
+        migrations.RemoveField(
+            model_name='expense',
+            name='receipt_image',
+        ),
+        migrations.RemoveField(
+            model_name='trip',
+            name='thumbnail',
+        ),
+        migrations.RemoveField(
+            model_name='triplogphoto',
+            name='image_url',
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0007_mediaasset_remove_expense_receipt_image_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='budget',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='dayplan',
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name='budget',
+            name='trip',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='budgets', to='trips.trip', verbose_name='여행'),
+        ),
+        migrations.AlterField(
+            model_name='dayplan',
+            name='trip',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='day_plans', to='trips.trip', verbose_name='여행'),
+        ),
+        migrations.AddConstraint(
+            model_name='budget',
+            constraint=models.UniqueConstraint(fields=('trip', 'category'), name='uniq_budget_trip_cat'),
+        ),
+        migrations.AddConstraint(
+            model_name='dayplan',
+            constraint=models.UniqueConstraint(fields=('trip', 'day_number'), name='uniq_dayplan_trip_day'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0008_alter_budget_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='destination',
+            name='trip',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='destinations', to='trips.trip', verbose_name='여행'),
+        ),
+        migrations.AlterField(
+            model_name='expense',
+            name='trip',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='expenses', to='trips.trip', verbose_name='여행'),
+        ),
+        migrations.AlterField(
+            model_name='triplog',
+            name='trip',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='logs', to='trips.trip', verbose_name='여행'),
+        ),
+        migrations.AlterField(
+            model_name='triplogphoto',
+            name='log',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='photos', to='trips.triplog', verbose_name='여행 기록'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-08-29 01:55
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_destination_count(apps, schema_editor):
+    Trip = apps.get_model('trips', 'Trip')
+    Destination = apps.get_model('trips', 'Destination')
+    counts = Destination.objects.values('trip').annotate(c=Count('id'))
+    for row in counts:
+        Trip.objects.filter(pk=row['trip']).update(destination_count=row['c'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0009_alter_destination_trip_alter_expense_trip_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trip',
+            name='destination_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='여행지 수'),
+        ),
+        migrations.RunPython(backfill_destination_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trips', '0010_trip_destination_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='triplog',
+            index=models.Index(fields=['trip', 'day_number', 'visit_status'], name='trips_tripl_trip_id_25de57_idx'),
+        ),
+    ]
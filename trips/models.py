@@ -1,7 +1,136 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Case, F, OuterRef, Prefetch, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, ExtractDay, Round
 from django.core.validators import MinValueValidator, MaxValueValidator
-from decimal import Decimal
+from django.utils.functional import cached_property
+
+
+class TripQuerySet(models.QuerySet):
+    def with_totals(self):
+        """예산/지출/예상비용 합계를 서브쿼리 annotation으로 한 번에 조회
+
+        합계별로 독립된 서브쿼리를 사용해 다중 JOIN 시 합계가 뻥튀기되는
+        문제를 피합니다. annotation이 붙은 인스턴스는 total_* 프로퍼티가
+        추가 쿼리 없이 이 값을 그대로 사용합니다.
+        """
+        budget_total = Budget.objects.filter(trip=OuterRef('pk')).values('trip').annotate(
+            s=Sum('amount')
+        ).values('s')
+        expense_total = Expense.objects.filter(trip=OuterRef('pk')).values('trip').annotate(
+            s=Sum('amount')
+        ).values('s')
+        estimated_total = Destination.objects.filter(trip=OuterRef('pk')).values('trip').annotate(
+            s=Sum('estimated_cost')
+        ).values('s')
+
+        bigint_field = models.BigIntegerField()
+        return self.annotate(
+            total_budget_agg=Coalesce(Subquery(budget_total), 0, output_field=bigint_field),
+            total_expense_agg=Coalesce(Subquery(expense_total), 0, output_field=bigint_field),
+            total_estimated_cost_agg=Coalesce(Subquery(estimated_total), 0, output_field=bigint_field),
+        )
+
+    def for_list(self):
+        """목록 응답에 필요한 컬럼만 로드 (updated_at 등 미사용 컬럼 제외)
+
+        description은 목록 serializer가 노출하므로 남겨두고, 나머지
+        미사용 컬럼을 빼 행 전송량과 인스턴스 생성 비용을 줄입니다.
+        """
+        return self.only(
+            "id", "title", "description", "start_date", "end_date",
+            "thumbnail_asset", "status", "is_public", "created_at", "user_id",
+            "destination_count",
+        )
+
+    def full(self):
+        """상세 응답용 표준 prefetch 묶음
+
+        상세 serializer가 걷는 중첩 관계를 전부 미리 로드해 여행 규모와
+        무관하게 고정된 쿼리 수로 직렬화합니다.
+        """
+        return self.select_related("user", "thumbnail_asset").prefetch_related(
+            "destinations",
+            "day_plans",
+            Prefetch("budgets", queryset=Budget.objects.with_usage()),
+            Prefetch(
+                "expenses",
+                queryset=Expense.objects.select_related("receipt_image_asset").annotate(
+                    destination_name=F("destination__name")
+                ),
+            ),
+            Prefetch(
+                "logs",
+                queryset=TripLog.objects.annotate(
+                    destination_name=F("destination__name")
+                ).prefetch_related(
+                    Prefetch("photos", queryset=TripLogPhoto.objects.select_related("image_asset"))
+                ),
+            ),
+        )
+
+    def category_rollup(self, trip_ids):
+        """여러 여행의 카테고리별 예산 대비 지출을 단일 쿼리로 집계
+
+        대시보드처럼 여행 수가 많은 화면에서 여행·카테고리당 쿼리를
+        반복하지 않고 한 번의 라운드트립으로 rollup 행을 돌려줍니다.
+        """
+        return (
+            Budget.objects.filter(trip_id__in=trip_ids)
+            .with_usage()
+            .values("trip_id", "category", "amount", "spent_amount_agg", "usage_percent_agg")
+            .order_by("trip_id", "category")
+        )
+
+    def with_stats(self):
+        """합계 annotation에 더해 기간/예산 사용률을 SQL로 계산
+
+        duration_days_agg / budget_usage_percent_agg로 ORDER BY·filter가
+        가능해지고, 직렬화 시 행마다 파이썬 연산을 하지 않습니다.
+        """
+        return self.with_totals().annotate(
+            # DateField 뺄셈은 interval로 컴파일되므로 일수만 정수로 추출
+            duration_days_agg=models.ExpressionWrapper(
+                ExtractDay(F("end_date") - F("start_date")) + Value(1),
+                output_field=models.IntegerField(),
+            ),
+            budget_usage_percent_agg=Case(
+                When(total_budget_agg=0, then=Value(0.0)),
+                default=Round(
+                    F("total_expense_agg") * 100.0 / F("total_budget_agg"), 1
+                ),
+                output_field=models.FloatField(),
+            ),
+        )
+
+
+class MediaAsset(models.Model):
+    """이미지 URL 인터닝 테이블
+
+    썸네일/영수증/사진 URL을 행마다 중복 저장하지 않고 공유 FK로
+    참조해 행 크기와 인덱스 크기를 줄입니다.
+    """
+    url = models.URLField(
+        max_length=500,
+        unique=True,
+        verbose_name="URL"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+
+    class Meta:
+        verbose_name = "미디어 자산"
+        verbose_name_plural = "미디어 자산 목록"
+
+    def __str__(self):
+        return self.url
+
+    @classmethod
+    def intern(cls, url):
+        """URL을 자산 행으로 변환 (이미 있으면 재사용)"""
+        if not url:
+            return None
+        asset, _ = cls.objects.get_or_create(url=url)
+        return asset
 
 
 class Trip(models.Model):
@@ -26,16 +155,22 @@ class Trip(models.Model):
     end_date = models.DateField(
         verbose_name="종료일"
     )
-    thumbnail = models.URLField(
-        max_length=500,
-        blank=True,
+    thumbnail_asset = models.ForeignKey(
+        MediaAsset,
+        on_delete=models.PROTECT,
         null=True,
+        blank=True,
+        related_name="+",
         verbose_name="썸네일 이미지"
     )
     is_public = models.BooleanField(
         default=False,
         verbose_name="공개 여부"
     )
+    destination_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="여행지 수"  # Destination 시그널이 유지하는 역정규화 카운터
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
     
@@ -52,6 +187,8 @@ class Trip(models.Model):
         verbose_name="상태"
     )
 
+    objects = TripQuerySet.as_manager()
+
 
     class Meta:
         verbose_name = "여행"
@@ -60,42 +197,106 @@ class Trip(models.Model):
 
     def __str__(self):
         return f"{self.title} ({self.start_date} ~ {self.end_date})"
-    
+
     @property
+    def thumbnail(self):
+        # 기존 URLField와 같은 인터페이스 유지 (serializer 변경 최소화)
+        return self.thumbnail_asset.url if self.thumbnail_asset_id else None
+
+    @thumbnail.setter
+    def thumbnail(self, value):
+        self.thumbnail_asset = MediaAsset.intern(value)
+
+    @cached_property
     def duration_days(self):
+        agg = getattr(self, "duration_days_agg", None)
+        if agg is not None:
+            return agg
         return (self.end_date - self.start_date).days + 1
     
-    @property
+    @cached_property
     def destination_names(self):
+        # prefetch_related('destinations')된 경우 캐시를 사용해 추가 쿼리 방지
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "destinations" in prefetched:
+            return [d.name for d in prefetched["destinations"]]
         return list(self.destinations.values_list("name", flat=True))
     
-    @property
+    @cached_property
     def total_budget(self):
+        # with_totals()로 annotate된 경우 추가 쿼리 없이 사용
+        agg = getattr(self, "total_budget_agg", None)
+        if agg is not None:
+            return agg
         return self.budgets.aggregate(
             total=models.Sum("amount")
-        )["total"] or Decimal("0")
-    
-    @property
+        )["total"] or 0
+
+    @cached_property
     def total_expense(self):
+        agg = getattr(self, "total_expense_agg", None)
+        if agg is not None:
+            return agg
         return self.expenses.aggregate(
             total=models.Sum("amount")
-        )["total"] or Decimal("0")
+        )["total"] or 0
     
     @property
     def budget_remaining(self):
         return self.total_budget - self.total_expense
     
-    @property
+    @cached_property
     def budget_usage_percent(self):
+        agg = getattr(self, "budget_usage_percent_agg", None)
+        if agg is not None:
+            return agg
         if self.total_budget == 0:
             return 0
         return round((self.total_expense / self.total_budget) * 100, 1)
     
-    @property
+    def expense_totals_by_category(self):
+        """카테고리별 지출 합계를 한 번의 GROUP BY로 조회"""
+        return {
+            row["category"]: row["total"]
+            for row in self.expenses.values("category").annotate(total=models.Sum("amount"))
+        }
+
+    def budgets_with_spent(self):
+        """지출 합계 맵이 주입된 예산 목록 (카테고리별 집계 쿼리 방지)"""
+        budgets = list(self.budgets.all())
+        totals = self.expense_totals_by_category()
+        for budget in budgets:
+            budget._spent_by_category = totals
+        return budgets
+
+    def cached_totals(self):
+        """합계 3종을 캐시에서 조회
+
+        Budget/Expense/Destination 저장·삭제 시그널이 키를 무효화하므로
+        대시보드처럼 읽기가 잦은 화면에서 GROUP BY 대신 캐시 GET 한 번으로
+        끝납니다. 캐시 미스 시 annotation/aggregate 경로로 계산해 채웁니다.
+        """
+        from django.core.cache import cache
+
+        key = f"trip:{self.pk}:totals"
+        totals = cache.get(key)
+        if totals is None:
+            totals = {
+                "total_budget": self.total_budget,
+                "total_expense": self.total_expense,
+                "total_estimated_cost": self.total_estimated_cost,
+            }
+            cache.set(key, totals, timeout=60 * 60)
+        return totals
+
+    @cached_property
     def total_estimated_cost(self):
+        agg = getattr(self, "total_estimated_cost_agg", None)
+        if agg is not None:
+            return agg
         return self.destinations.aggregate(
             total=models.Sum("estimated_cost")
-        )["total"] or Decimal("0")
+        )["total"] or 0
 
 
 class Destination(models.Model):
@@ -103,6 +304,7 @@ class Destination(models.Model):
         Trip,
         on_delete=models.CASCADE,
         related_name="destinations",
+        db_index=False,  # (trip, day, order) 복합 인덱스의 선두 컬럼이 대신함
         verbose_name="여행"
     )
     name = models.CharField(
@@ -114,16 +316,12 @@ class Destination(models.Model):
         blank=True,
         verbose_name="주소"
     )
-    latitude = models.DecimalField(
-        max_digits=10,
-        decimal_places=7,
+    latitude = models.FloatField(
         null=True,
         blank=True,
         verbose_name="위도"
     )
-    longitude = models.DecimalField(
-        max_digits=10,
-        decimal_places=7,
+    longitude = models.FloatField(
         null=True,
         blank=True,
         verbose_name="경도"
@@ -146,10 +344,9 @@ class Destination(models.Model):
         blank=True,
         verbose_name="예상 체류 시간(분)"
     )
-    estimated_cost = models.DecimalField(
-        max_digits=12,
-        decimal_places=0,
+    estimated_cost = models.BigIntegerField(
         default=0,
+        validators=[MinValueValidator(0)],
         verbose_name="예상 비용"
     )
     memo = models.TextField(
@@ -180,6 +377,9 @@ class Destination(models.Model):
         verbose_name = "여행지"
         verbose_name_plural = "여행지 목록"
         ordering = ["day", "order"]
+        indexes = [
+            models.Index(fields=["trip", "day", "order"]),
+        ]
 
     def __str__(self):
         return f"[{self.trip.title}] Day{self.day} - {self.name}"
@@ -190,6 +390,7 @@ class DayPlan(models.Model):
         Trip,
         on_delete=models.CASCADE,
         related_name="day_plans",
+        db_index=False,  # (trip, day_number) 유니크 제약의 선두 컬럼이 대신함
         verbose_name="여행"
     )
     day_number = models.PositiveIntegerField(
@@ -210,7 +411,9 @@ class DayPlan(models.Model):
         verbose_name = "일자별 계획"
         verbose_name_plural = "일자별 계획 목록"
         ordering = ["day_number"]
-        unique_together = ("trip", "day_number")
+        constraints = [
+            models.UniqueConstraint(fields=["trip", "day_number"], name="uniq_dayplan_trip_day"),
+        ]
 
     def __str__(self):
         return f"[{self.trip.title}] Day {self.day_number}"
@@ -220,12 +423,12 @@ class DayPlan(models.Model):
         """해당 일차의 여행지 목록"""
         return self.trip.destinations.filter(day=self.day_number)
     
-    @property
+    @cached_property
     def estimated_cost(self):
         """해당 일차 예상 비용"""
         return self.destinations.aggregate(
             total=models.Sum("estimated_cost")
-        )["total"] or Decimal("0")
+        )["total"] or 0
 
 
 class BudgetCategory(models.TextChoices):
@@ -238,11 +441,33 @@ class BudgetCategory(models.TextChoices):
     OTHER = "other", "기타"
 
 
+class BudgetQuerySet(models.QuerySet):
+    def with_usage(self):
+        """카테고리별 지출 합계와 사용률을 SQL annotation으로 계산"""
+        spent = Expense.objects.filter(
+            trip=OuterRef("trip"), category=OuterRef("category")
+        ).values("category").annotate(s=Sum("amount")).values("s")
+        return self.annotate(
+            spent_amount_agg=Coalesce(
+                Subquery(spent),
+                0,
+                output_field=models.BigIntegerField(),
+            ),
+        ).annotate(
+            usage_percent_agg=Case(
+                When(amount=0, then=Value(0.0)),
+                default=Round(F("spent_amount_agg") * 100.0 / F("amount"), 1),
+                output_field=models.FloatField(),
+            ),
+        )
+
+
 class Budget(models.Model):
     trip = models.ForeignKey(
         Trip,
         on_delete=models.CASCADE,
         related_name="budgets",
+        db_index=False,  # (trip, category) 유니크 제약의 선두 컬럼이 대신함
         verbose_name="여행"
     )
     category = models.CharField(
@@ -250,10 +475,8 @@ class Budget(models.Model):
         choices=BudgetCategory.choices,
         verbose_name="카테고리"
     )
-    amount = models.DecimalField(
-        max_digits=12,
-        decimal_places=0,
-        validators=[MinValueValidator(Decimal("0"))],
+    amount = models.BigIntegerField(
+        validators=[MinValueValidator(0)],
         verbose_name="예산 금액"
     )
     memo = models.CharField(
@@ -264,42 +487,64 @@ class Budget(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
+    objects = BudgetQuerySet.as_manager()
+
     class Meta:
         verbose_name = "예산"
         verbose_name_plural = "예산 목록"
-        unique_together = ("trip", "category")
         ordering = ["category"]
+        constraints = [
+            models.UniqueConstraint(fields=["trip", "category"], name="uniq_budget_trip_cat"),
+        ]
 
     def __str__(self):
         return f"[{self.trip.title}] {self.get_category_display()}: {self.amount:,}원"
     
-    @property
+    @cached_property
     def spent_amount(self):
-        """해당 카테고리 지출 금액"""
+        """해당 카테고리 지출 금액 (Trip.budgets_with_spent()로 주입된 맵 우선 사용)"""
+        agg = getattr(self, "spent_amount_agg", None)
+        if agg is not None:
+            return agg
+        totals = getattr(self, "_spent_by_category", None)
+        if totals is not None:
+            return totals.get(self.category) or 0
         return self.trip.expenses.filter(
             category=self.category
         ).aggregate(
             total=models.Sum("amount")
-        )["total"] or Decimal("0")
+        )["total"] or 0
     
     @property
     def remaining_amount(self):
         """남은 금액"""
         return self.amount - self.spent_amount
     
-    @property
+    @cached_property
     def usage_percent(self):
         """사용률 (%)"""
+        agg = getattr(self, "usage_percent_agg", None)
+        if agg is not None:
+            return agg
         if self.amount == 0:
             return 0
         return round((self.spent_amount / self.amount) * 100, 1)
 
 
+class ExpenseManager(models.Manager):
+    def get_queryset(self):
+        # __str__/admin이 trip.title에 접근하므로 기본적으로 JOIN해 N+1 방지
+        return super().get_queryset().select_related(
+            "trip", "destination", "receipt_image_asset"
+        )
+
+
 class Expense(models.Model):
     trip = models.ForeignKey(
         Trip,
         on_delete=models.CASCADE,
         related_name="expenses",
+        db_index=False,  # (trip, expense_date, expense_time) 복합 인덱스가 대신함
         verbose_name="여행"
     )
     category = models.CharField(
@@ -307,10 +552,8 @@ class Expense(models.Model):
         choices=BudgetCategory.choices,
         verbose_name="카테고리"
     )
-    amount = models.DecimalField(
-        max_digits=12,
-        decimal_places=0,
-        validators=[MinValueValidator(Decimal("0"))],
+    amount = models.BigIntegerField(
+        validators=[MinValueValidator(0)],
         verbose_name="금액"
     )
     description = models.CharField(
@@ -351,40 +594,84 @@ class Expense(models.Model):
         default=PaymentMethod.CARD,
         verbose_name="결제 수단"
     )
-    receipt_image = models.URLField(
-        max_length=500,
+    receipt_image_asset = models.ForeignKey(
+        MediaAsset,
+        on_delete=models.PROTECT,
+        null=True,
         blank=True,
+        related_name="+",
         verbose_name="영수증 이미지"
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
+    objects = ExpenseManager()
+
     class Meta:
         verbose_name = "지출"
         verbose_name_plural = "지출 목록"
         ordering = ["expense_date", "expense_time"]
+        indexes = [
+            models.Index(fields=["trip", "expense_date", "expense_time"]),
+            models.Index(fields=["trip", "category"]),
+        ]
 
     def __str__(self):
         return f"[{self.trip.title}] {self.description}: {self.amount:,}원"
-    
+
+    @property
+    def receipt_image(self):
+        return self.receipt_image_asset.url if self.receipt_image_asset_id else ""
+
+    @receipt_image.setter
+    def receipt_image(self, value):
+        self.receipt_image_asset = MediaAsset.intern(value)
+
+    @classmethod
+    def bulk_create_for_trip(cls, trip, expenses, batch_size=1000):
+        """지출 N건을 multi-VALUES INSERT 한 번으로 저장
+
+        bulk_create는 save()를 건너뛰지만 day_number는 DB 트리거가
+        채우므로 가져오기/동기화 경로에서 행당 INSERT를 피할 수 있습니다.
+        """
+        for expense in expenses:
+            expense.trip = trip
+        return cls.objects.bulk_create(expenses, batch_size=batch_size)
+
+    def _trip_start_date(self):
+        """Trip 전체를 하이드레이션하지 않고 시작일만 조회
+
+        trip이 이미 메모리에 있으면 그대로 사용하고, FK id만 있는 경우
+        start_date 컬럼 하나만 SELECT합니다.
+        """
+        if "trip" in self._state.fields_cache:
+            return self.trip.start_date
+        return Trip.objects.values_list("start_date", flat=True).get(pk=self.trip_id)
+
     def save(self, *args, **kwargs):
         if self.day_number is None and self.expense_date:
-            delta = (self.expense_date - self.trip.start_date).days
+            delta = (self.expense_date - self._trip_start_date()).days
             if delta >= 0:
                 self.day_number = delta + 1
         super().save(*args, **kwargs)
 
 
+class TripLogManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("trip", "destination")
+
+
 class TripLog(models.Model):
     """
     여행 기록 모델
-    
+
     실제 방문한 장소 및 경험 기록
     """
     trip = models.ForeignKey(
         Trip,
         on_delete=models.CASCADE,
         related_name="logs",
+        db_index=False,  # (trip, visit_date, visit_time) 복합 인덱스가 대신함
         verbose_name="여행"
     )
     destination = models.ForeignKey(
@@ -404,16 +691,12 @@ class TripLog(models.Model):
         blank=True,
         verbose_name="주소"
     )
-    latitude = models.DecimalField(
-        max_digits=10,
-        decimal_places=7,
+    latitude = models.FloatField(
         null=True,
         blank=True,
         verbose_name="위도"
     )
-    longitude = models.DecimalField(
-        max_digits=10,
-        decimal_places=7,
+    longitude = models.FloatField(
         null=True,
         blank=True,
         verbose_name="경도"
@@ -462,29 +745,66 @@ class TripLog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
+    objects = TripLogManager()
+
     class Meta:
         verbose_name = "여행 기록"
         verbose_name_plural = "여행 기록 목록"
         ordering = ["visit_date", "visit_time"]
+        indexes = [
+            models.Index(fields=["trip", "visit_date", "visit_time"]),
+            # 일정 비교의 일차·방문상태 집계가 인덱스만으로 풀리도록
+            models.Index(fields=["trip", "day_number", "visit_status"]),
+        ]
 
     def __str__(self):
         return f"[{self.trip.title}] {self.place_name}"
-    
+
+    @classmethod
+    def bulk_create_for_trip(cls, trip, logs, batch_size=1000):
+        """여행 기록 N건을 multi-VALUES INSERT 한 번으로 저장 (day_number는 트리거가 채움)"""
+        for log in logs:
+            log.trip = trip
+        return cls.objects.bulk_create(logs, batch_size=batch_size)
+
+    def _trip_start_date(self):
+        """Trip 전체를 하이드레이션하지 않고 시작일만 조회"""
+        if "trip" in self._state.fields_cache:
+            return self.trip.start_date
+        return Trip.objects.values_list("start_date", flat=True).get(pk=self.trip_id)
+
     def save(self, *args, **kwargs):
         if self.day_number is None and self.visit_date:
-            delta = (self.visit_date - self.trip.start_date).days
+            delta = (self.visit_date - self._trip_start_date()).days
             if delta >= 0:
                 self.day_number = delta + 1
-        
-        if self.destination and not self.place_name:
-            self.place_name = self.destination.name
-            self.address = self.destination.address
-            self.latitude = self.destination.latitude
-            self.longitude = self.destination.longitude
-        
+
+        if self.destination_id and not self.place_name:
+            if "destination" in self._state.fields_cache:
+                source = self.destination
+                self.place_name = source.name
+                self.address = source.address
+                self.latitude = source.latitude
+                self.longitude = source.longitude
+            else:
+                # FK id만 있는 경우 필요한 4개 컬럼만 조회 (전체 행 하이드레이션 방지)
+                vals = Destination.objects.filter(pk=self.destination_id).values(
+                    "name", "address", "latitude", "longitude"
+                ).first()
+                if vals:
+                    self.place_name = vals["name"]
+                    self.address = vals["address"]
+                    self.latitude = vals["latitude"]
+                    self.longitude = vals["longitude"]
+
         super().save(*args, **kwargs)
 
 
+class TripLogPhotoManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("log__trip", "image_asset")
+
+
 class TripLogPhoto(models.Model):
     """
     여행 기록 사진 모델
@@ -493,11 +813,15 @@ class TripLogPhoto(models.Model):
         TripLog,
         on_delete=models.CASCADE,
         related_name="photos",
+        db_index=False,  # (log, order) 복합 인덱스의 선두 컬럼이 대신함
         verbose_name="여행 기록"
     )
-    image_url = models.URLField(
-        max_length=500,
-        verbose_name="이미지 URL"
+    image_asset = models.ForeignKey(
+        MediaAsset,
+        on_delete=models.PROTECT,
+        null=True,
+        related_name="+",
+        verbose_name="이미지"
     )
     caption = models.CharField(
         max_length=200,
@@ -510,10 +834,23 @@ class TripLogPhoto(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
 
+    objects = TripLogPhotoManager()
+
+    @property
+    def image_url(self):
+        return self.image_asset.url if self.image_asset_id else ""
+
+    @image_url.setter
+    def image_url(self, value):
+        self.image_asset = MediaAsset.intern(value)
+
     class Meta:
         verbose_name = "여행 사진"
         verbose_name_plural = "여행 사진 목록"
         ordering = ["order"]
+        indexes = [
+            models.Index(fields=["log", "order"]),
+        ]
 
     def __str__(self):
         return f"[{self.log.place_name}] 사진 {self.order + 1}"
\ No newline at end of file
@@ -0,0 +1,27 @@
+from decimal import Decimal
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+def _default(obj):
+    """orjson이 모르는 타입 처리 (Decimal 등)"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONRenderer(JSONRenderer):
+    """orjson 기반 JSON 렌더러
+
+    날짜/숫자 위주의 큰 응답(여행 상세, 비교 등)에서 stdlib json 대비
+    직렬화 CPU 비용을 크게 줄입니다. 미디어 타입/협상 동작은
+    JSONRenderer를 그대로 따릅니다.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # DRF 검증 오류는 ListField 항목에 정수 키를 쓰므로(e.g. {'photos': {0: [...]}})
+        # 비문자열 키 옵션이 없으면 400 응답이 렌더링 단계에서 500이 됩니다.
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -1,5 +1,8 @@
-from decimal import Decimal
-from django.db import models
+import copy
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import models, transaction
 from rest_framework import serializers
 from trips.models import (
     Trip, Destination, DayPlan,
@@ -8,8 +11,51 @@ from trips.models import (
 )
 
 
-class DestinationSerializer(serializers.ModelSerializer):
-    category_display = serializers.CharField(source="get_category_display", read_only=True)
+# 선택지 라벨을 모듈 로드 시 한 번만 dict로 구성 (행마다 get_*_display 호출 방지)
+_DESTINATION_CATEGORY_LABELS = dict(Destination.Category.choices)
+_BUDGET_CHOICES = tuple(BudgetCategory.choices)
+_BUDGET_CATEGORY_LABELS = dict(_BUDGET_CHOICES)
+_PAYMENT_METHOD_LABELS = dict(Expense.PaymentMethod.choices)
+_VISIT_STATUS_LABELS = dict(TripLog.VisitStatus.choices)
+
+# 기간(일수) = (end - start).days + 1 이므로 30일 초과 ⇔ 차이가 29일 초과
+_MAX_TRIP_DELTA = timedelta(days=29)
+
+
+class CachedFieldsMixin:
+    """get_fields()의 모델 인트로스펙션 결과를 serializer 클래스별로 캐시
+
+    목록 엔드포인트는 요청마다 serializer를 새로 만들며 그때마다
+    get_fields()가 모델 메타를 다시 훑습니다. 첫 호출 결과를 클래스
+    단위로 보관하고 이후에는 deepcopy만 돌려줘 인트로스펙션을 생략합니다.
+    deepcopy는 바인딩되지 않은 새 필드를 만들므로 요청 간에 바인딩된
+    필드가 공유되지 않습니다.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        cached = CachedFieldsMixin._fields_cache.get(cls)
+        if cached is None:
+            cached = CachedFieldsMixin._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(cached)
+
+
+def _build_day_plans(trip):
+    """여행 기간 전체의 DayPlan 인스턴스 목록 생성 (bulk_create용)"""
+    return [
+        DayPlan(
+            trip=trip,
+            day_number=i + 1,
+            date=trip.start_date + timedelta(days=i),
+        )
+        for i in range((trip.end_date - trip.start_date).days + 1)
+    ]
+
+
+class DestinationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    category_display = serializers.SerializerMethodField()
     
     class Meta:
         model = Destination
@@ -31,6 +77,9 @@ class DestinationSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "created_at")
 
+    def get_category_display(self, obj):
+        return _DESTINATION_CATEGORY_LABELS.get(obj.category, "")
+
 
 class DestinationCreateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -52,13 +101,19 @@ class DestinationCreateSerializer(serializers.ModelSerializer):
     def validate_day(self, value):
         if value < 1:
             raise serializers.ValidationError("일차는 1 이상이어야 합니다.")
+        # 뷰가 context로 넘긴 trip의 기간(cached_property)으로 상한 검사
+        trip = self.context.get("trip")
+        if trip and value > trip.duration_days:
+            raise serializers.ValidationError(
+                f"일차는 {trip.duration_days}일 이내여야 합니다."
+            )
         return value
 
 
-class BudgetSerializer(serializers.ModelSerializer):
-    category_display = serializers.CharField(source="get_category_display", read_only=True)
-    spent_amount = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
-    remaining_amount = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
+class BudgetSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    category_display = serializers.SerializerMethodField()
+    spent_amount = serializers.IntegerField(read_only=True)
+    remaining_amount = serializers.IntegerField(read_only=True)
     usage_percent = serializers.FloatField(read_only=True)
     
     class Meta:
@@ -77,6 +132,9 @@ class BudgetSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "created_at", "updated_at")
 
+    def get_category_display(self, obj):
+        return _BUDGET_CATEGORY_LABELS.get(obj.category, "")
+
 
 class BudgetCreateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -93,10 +151,14 @@ class BudgetCreateSerializer(serializers.ModelSerializer):
         return value
 
 
-class ExpenseSerializer(serializers.ModelSerializer):
-    category_display = serializers.CharField(source="get_category_display", read_only=True)
-    payment_method_display = serializers.CharField(source="get_payment_method_display", read_only=True)
-    destination_name = serializers.CharField(source="destination.name", read_only=True, allow_null=True)
+class ExpenseSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    category_display = serializers.SerializerMethodField()
+    # receipt_image는 모델에서 MediaAsset FK를 감싸는 프로퍼티이므로 명시 선언
+    # (setter가 인터닝을 처리하므로 수정 시에도 쓸 수 있어야 함)
+    receipt_image = serializers.URLField(required=False, allow_blank=True)
+    payment_method_display = serializers.SerializerMethodField()
+    # 점(.) 소스 탐색 대신 쿼리셋 annotation으로 평탄화된 속성을 읽음
+    destination_name = serializers.CharField(read_only=True, allow_null=True)
     
     class Meta:
         model = Expense
@@ -119,8 +181,24 @@ class ExpenseSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "day_number", "created_at", "updated_at")
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """이 serializer가 걷는 관계를 미리 로드 (뷰 쿼리셋에서 호출)"""
+        return queryset.select_related("receipt_image_asset").annotate(
+            destination_name=models.F("destination__name")
+        )
+
+    def get_category_display(self, obj):
+        return _BUDGET_CATEGORY_LABELS.get(obj.category, "")
+
+    def get_payment_method_display(self, obj):
+        return _PAYMENT_METHOD_LABELS.get(obj.payment_method, "")
+
 
 class ExpenseCreateSerializer(serializers.ModelSerializer):
+    # receipt_image는 모델에서 MediaAsset FK를 감싸는 프로퍼티이므로 명시 선언
+    receipt_image = serializers.URLField(required=False, allow_blank=True)
+
     class Meta:
         model = Expense
         fields = (
@@ -164,10 +242,11 @@ class TripLogPhotoSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at")
 
 
-class TripLogSerializer(serializers.ModelSerializer):
+class TripLogSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     photos = TripLogPhotoSerializer(many=True, read_only=True)
-    visit_status_display = serializers.CharField(source="get_visit_status_display", read_only=True)
-    destination_name = serializers.CharField(source="destination.name", read_only=True, allow_null=True)
+    visit_status_display = serializers.SerializerMethodField()
+    # 점(.) 소스 탐색 대신 쿼리셋 annotation으로 평탄화된 속성을 읽음
+    destination_name = serializers.CharField(read_only=True, allow_null=True)
     
     class Meta:
         model = TripLog
@@ -193,6 +272,21 @@ class TripLogSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "day_number", "created_at", "updated_at")
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """이 serializer가 걷는 관계를 미리 로드 (뷰 쿼리셋에서 호출)"""
+        return queryset.annotate(
+            destination_name=models.F("destination__name")
+        ).prefetch_related(
+            models.Prefetch(
+                "photos",
+                queryset=TripLogPhoto.objects.select_related("image_asset"),
+            )
+        )
+
+    def get_visit_status_display(self, obj):
+        return _VISIT_STATUS_LABELS.get(obj.visit_status, "")
+
 
 class TripLogCreateSerializer(serializers.ModelSerializer):
     photos = serializers.ListField(
@@ -225,25 +319,26 @@ class TripLogCreateSerializer(serializers.ModelSerializer):
     
     def create(self, validated_data):
         photos_data = validated_data.pop("photos", [])
-        trip_log = TripLog.objects.create(**validated_data)
-        
-        # 사진 생성
-        for idx, photo_url in enumerate(photos_data):
-            TripLogPhoto.objects.create(
-                log=trip_log,
-                image_url=photo_url,
-                order=idx
-            )
-        
+
+        with transaction.atomic():
+            trip_log = TripLog.objects.create(**validated_data)
+
+            # 사진은 multi-VALUES INSERT 한 번으로 생성
+            if photos_data:
+                TripLogPhoto.objects.bulk_create(
+                    [
+                        TripLogPhoto(log=trip_log, image_url=photo_url, order=idx)
+                        for idx, photo_url in enumerate(photos_data)
+                    ],
+                    batch_size=100,
+                )
+
         return trip_log
 
 
-class DayPlanSerializer(serializers.ModelSerializer):
-    destinations = serializers.SerializerMethodField()
-    estimated_cost = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
-    expenses = serializers.SerializerMethodField()
-    logs = serializers.SerializerMethodField()
-    
+class DayPlanSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    estimated_cost = serializers.IntegerField(read_only=True)
+
     class Meta:
         model = DayPlan
         fields = (
@@ -252,51 +347,67 @@ class DayPlanSerializer(serializers.ModelSerializer):
             "date",
             "memo",
             "estimated_cost",
-            "destinations",
-            "expenses",
-            "logs",
         )
         read_only_fields = ("id",)
-    
-    def get_destinations(self, obj):
-        destinations = obj.trip.destinations.filter(day=obj.day_number)
-        return DestinationSerializer(destinations, many=True).data
-    
-    def get_expenses(self, obj):
-        expenses = obj.trip.expenses.filter(day_number=obj.day_number)
-        return ExpenseSerializer(expenses, many=True).data
-    
-    def get_logs(self, obj):
-        logs = obj.trip.logs.filter(day_number=obj.day_number)
-        return TripLogSerializer(logs, many=True).data
+
+    def to_representation(self, obj):
+        # SerializerMethodField의 행당 디스패치 비용 없이 중첩 목록을 직접 부착
+        rep = super().to_representation(obj)
+
+        dest_by_day = self.context.get("dest_by_day")
+        if dest_by_day is not None:
+            destinations = dest_by_day.get(obj.day_number, [])
+        else:
+            destinations = obj.trip.destinations.filter(day=obj.day_number)
+        rep["destinations"] = DestinationSerializer(destinations, many=True).data
+
+        exp_by_day = self.context.get("exp_by_day")
+        if exp_by_day is not None:
+            expenses = exp_by_day.get(obj.day_number, [])
+        else:
+            expenses = ExpenseSerializer.setup_eager_loading(
+                obj.trip.expenses.filter(day_number=obj.day_number)
+            )
+        rep["expenses"] = ExpenseSerializer(expenses, many=True).data
+
+        logs_by_day = self.context.get("logs_by_day")
+        if logs_by_day is not None:
+            logs = logs_by_day.get(obj.day_number, [])
+        else:
+            logs = TripLogSerializer.setup_eager_loading(
+                obj.trip.logs.filter(day_number=obj.day_number)
+            )
+        rep["logs"] = TripLogSerializer(logs, many=True).data
+
+        return rep
 
 
 class BudgetSummarySerializer(serializers.Serializer):
-    total_budget = serializers.DecimalField(max_digits=12, decimal_places=0)
-    total_expense = serializers.DecimalField(max_digits=12, decimal_places=0)
-    total_estimated_cost = serializers.DecimalField(max_digits=12, decimal_places=0)
-    remaining = serializers.DecimalField(max_digits=12, decimal_places=0)
+    total_budget = serializers.IntegerField()
+    total_expense = serializers.IntegerField()
+    total_estimated_cost = serializers.IntegerField()
+    remaining = serializers.IntegerField()
     usage_percent = serializers.FloatField()
     by_category = BudgetSerializer(many=True)
 
 
 class ExpenseSummarySerializer(serializers.Serializer):
-    total = serializers.DecimalField(max_digits=12, decimal_places=0)
+    total = serializers.IntegerField()
     by_category = serializers.DictField()
     by_day = serializers.DictField()
     by_payment_method = serializers.DictField()
 
 
-class TripListSerializer(serializers.ModelSerializer):
+class TripListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     duration_days = serializers.IntegerField(read_only=True)
     destination_names = serializers.ListField(
         child=serializers.CharField(),
         read_only=True
     )
-    destination_count = serializers.SerializerMethodField()
+    destination_count = serializers.IntegerField(read_only=True)
     status_display = serializers.CharField(source="get_status_display", read_only=True)
-    total_budget = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
-    total_expense = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
+    total_budget = serializers.IntegerField(read_only=True)
+    total_expense = serializers.IntegerField(read_only=True)
     budget_usage_percent = serializers.FloatField(read_only=True)
     
     class Meta:
@@ -320,9 +431,6 @@ class TripListSerializer(serializers.ModelSerializer):
             "created_at",
         )
         read_only_fields = fields
-    
-    def get_destination_count(self, obj):
-        return obj.destinations.count()
 
 
 class TripDetailSerializer(serializers.ModelSerializer):
@@ -333,10 +441,10 @@ class TripDetailSerializer(serializers.ModelSerializer):
     budgets = BudgetSerializer(many=True, read_only=True)
     
     # 예산 요약
-    total_budget = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
-    total_expense = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
-    total_estimated_cost = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
-    budget_remaining = serializers.DecimalField(max_digits=12, decimal_places=0, read_only=True)
+    total_budget = serializers.IntegerField(read_only=True)
+    total_expense = serializers.IntegerField(read_only=True)
+    total_estimated_cost = serializers.IntegerField(read_only=True)
+    budget_remaining = serializers.IntegerField(read_only=True)
     budget_usage_percent = serializers.FloatField(read_only=True)
     
     class Meta:
@@ -365,6 +473,26 @@ class TripDetailSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "created_at", "updated_at")
 
+    def to_representation(self, instance):
+        # prefetch된 관계들을 일차별로 한 번만 묶어 DayPlanSerializer가
+        # 일차마다 filter 쿼리를 내지 않도록 context로 전달
+        dest_by_day = defaultdict(list)
+        for destination in instance.destinations.all():
+            dest_by_day[destination.day].append(destination)
+
+        exp_by_day = defaultdict(list)
+        for expense in instance.expenses.all():
+            exp_by_day[expense.day_number].append(expense)
+
+        logs_by_day = defaultdict(list)
+        for log in instance.logs.all():
+            logs_by_day[log.day_number].append(log)
+
+        self.context["dest_by_day"] = dest_by_day
+        self.context["exp_by_day"] = exp_by_day
+        self.context["logs_by_day"] = logs_by_day
+        return super().to_representation(instance)
+
 
 class TripCreateSerializer(serializers.ModelSerializer):
     destinations = DestinationCreateSerializer(many=True, required=False)
@@ -394,55 +522,49 @@ class TripCreateSerializer(serializers.ModelSerializer):
                     "end_date": "종료일은 시작일 이후여야 합니다."
                 })
             
-            duration = (end_date - start_date).days + 1
-            if duration > 30:
+            if start_date != end_date and end_date - start_date > _MAX_TRIP_DELTA:
                 raise serializers.ValidationError({
                     "end_date": "여행 기간은 최대 30일까지 설정할 수 있습니다."
                 })
-        
+
         return attrs
-    
+
     def validate_title(self, value):
-        if len(value) < 2:
+        if not value or len(value) < 2:
             raise serializers.ValidationError("제목은 2자 이상이어야 합니다.")
         return value
     
     def create(self, validated_data):
         destinations_data = validated_data.pop("destinations", [])
         budgets_data = validated_data.pop("budgets", [])
-        
-        trip = Trip.objects.create(**validated_data)
-        
-        # Destination 생성
-        for dest_data in destinations_data:
-            Destination.objects.create(trip=trip, **dest_data)
-        
-        # Budget 생성
-        for budget_data in budgets_data:
-            Budget.objects.create(trip=trip, **budget_data)
-        
-        # DayPlan 자동 생성
-        self._create_day_plans(trip)
-        
+
+        with transaction.atomic():
+            trip = Trip.objects.create(**validated_data)
+
+            # 자식 행들은 건당 INSERT 대신 multi-VALUES INSERT로 생성
+            if destinations_data:
+                Destination.objects.bulk_create(
+                    [Destination(trip=trip, **dest_data) for dest_data in destinations_data]
+                )
+                # bulk_create는 시그널을 거치지 않으므로 카운터를 직접 채움
+                trip.destination_count = len(destinations_data)
+                Trip.objects.filter(pk=trip.pk).update(
+                    destination_count=trip.destination_count
+                )
+            if budgets_data:
+                Budget.objects.bulk_create(
+                    [Budget(trip=trip, **budget_data) for budget_data in budgets_data]
+                )
+
+            # DayPlan 자동 생성
+            DayPlan.objects.bulk_create(_build_day_plans(trip))
+
         return trip
-    
-    def _create_day_plans(self, trip):
-        from datetime import timedelta
-        
-        current_date = trip.start_date
-        day_number = 1
-        
-        while current_date <= trip.end_date:
-            DayPlan.objects.create(
-                trip=trip,
-                day_number=day_number,
-                date=current_date,
-            )
-            current_date += timedelta(days=1)
-            day_number += 1
 
 
 class TripUpdateSerializer(serializers.ModelSerializer):
+    thumbnail = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+
     class Meta:
         model = Trip
         fields = (
@@ -482,21 +604,32 @@ class TripUpdateSerializer(serializers.ModelSerializer):
         return instance
     
     def _update_day_plans(self, trip):
-        from datetime import timedelta
-        
-        trip.day_plans.all().delete()
-        
-        current_date = trip.start_date
-        day_number = 1
-        
-        while current_date <= trip.end_date:
-            DayPlan.objects.create(
-                trip=trip,
-                day_number=day_number,
-                date=current_date,
-            )
-            current_date += timedelta(days=1)
-            day_number += 1
+        """기간 변경분만 반영 (전체 삭제 후 재생성 대신 diff 적용)"""
+        total_days = (trip.end_date - trip.start_date).days + 1
+        desired = {
+            i + 1: trip.start_date + timedelta(days=i) for i in range(total_days)
+        }
+        existing = {dp.day_number: dp for dp in trip.day_plans.all()}
+
+        to_create = [
+            DayPlan(trip=trip, day_number=n, date=d)
+            for n, d in desired.items() if n not in existing
+        ]
+        to_update = [
+            existing[n] for n, d in desired.items()
+            if n in existing and existing[n].date != d
+        ]
+        for day_plan in to_update:
+            day_plan.date = desired[day_plan.day_number]
+        removed_numbers = [n for n in existing if n not in desired]
+
+        with transaction.atomic():
+            if removed_numbers:
+                trip.day_plans.filter(day_number__in=removed_numbers).delete()
+            if to_update:
+                DayPlan.objects.bulk_update(to_update, ["date"])
+            if to_create:
+                DayPlan.objects.bulk_create(to_create)
 
 
 class TripComparisonSerializer(serializers.Serializer):
@@ -511,67 +644,69 @@ class TripComparisonSerializer(serializers.Serializer):
     summary = serializers.SerializerMethodField()
     
     def get_budget_comparison(self, trip):
-        """카테고리별 예산 vs 실제 지출 비교"""
-        result = []
-        for category, label in BudgetCategory.choices:
-            budget = trip.budgets.filter(category=category).first()
-            budget_amount = budget.amount if budget else Decimal("0")
-            
-            expense_total = trip.expenses.filter(
-                category=category
-            ).aggregate(
-                total=models.Sum("amount")
-            )["total"] or Decimal("0")
-            
-            result.append({
+        """카테고리별 예산 vs 실제 지출 비교 (카테고리당 쿼리 대신 2회 조회)"""
+        budgets_map = {
+            row["category"]: row["amount"]
+            for row in trip.budgets.values("category", "amount")
+        }
+        expenses_map = trip.expense_totals_by_category()
+
+        return [
+            {
                 "category": category,
                 "category_display": label,
-                "budget": budget_amount,
-                "actual": expense_total,
+                "budget": (budget_amount := budgets_map.get(category, 0)),
+                "actual": (expense_total := expenses_map.get(category) or 0),
                 "difference": budget_amount - expense_total,
                 "usage_percent": round((expense_total / budget_amount * 100), 1) if budget_amount > 0 else 0,
-            })
-        
-        return result
+            }
+            for category, label in _BUDGET_CHOICES
+        ]
     
     def get_schedule_comparison(self, trip):
+        # 일차별 filter/count 반복 대신 전체를 두 번만 조회해 메모리에서 묶음
+        planned_by_day = defaultdict(set)
+        for day, name in trip.destinations.values_list("day", "name"):
+            planned_by_day[day].add(name)
+
+        actual_by_day = defaultdict(set)
+        for day_number, place_name in trip.logs.values_list("day_number", "place_name"):
+            actual_by_day[day_number].add(place_name)
+
         result = []
         for day_plan in trip.day_plans.all():
-            planned = trip.destinations.filter(day=day_plan.day_number)
-            actual = trip.logs.filter(day_number=day_plan.day_number)
-            
-            planned_names = set(planned.values_list("name", flat=True))
-            actual_names = set(actual.values_list("place_name", flat=True))
-            
+            planned_names = planned_by_day[day_plan.day_number]
+            actual_names = actual_by_day[day_plan.day_number]
+
             result.append({
                 "day_number": day_plan.day_number,
                 "date": day_plan.date,
-                "planned_count": planned.count(),
-                "actual_count": actual.count(),
+                "planned_count": len(planned_names),
+                "actual_count": len(actual_names),
                 "planned_places": list(planned_names),
                 "actual_places": list(actual_names),
                 "visited_as_planned": list(planned_names & actual_names),
                 "skipped": list(planned_names - actual_names),
                 "unplanned_visits": list(actual_names - planned_names),
             })
-        
+
         return result
     
     def get_summary(self, trip):
-        total_planned = trip.destinations.count()
-        total_visited = trip.logs.filter(
-            visit_status__in=["planned", "unplanned"]
-        ).count()
-        
-        planned_visited = trip.logs.filter(visit_status="planned").count()
-        unplanned_visited = trip.logs.filter(visit_status="unplanned").count()
-        skipped = trip.logs.filter(visit_status="skipped").count()
-        
-        avg_rating = trip.logs.filter(
-            rating__isnull=False
-        ).aggregate(
-            avg=models.Avg("rating")
-        )["avg"]
+        # 방문 상태별 건수와 평균 평점을 단일 스캔의 조건부 집계로 조회
+        agg = trip.logs.aggregate(
+            planned=models.Count("id", filter=models.Q(visit_status="planned")),
+            unplanned=models.Count("id", filter=models.Q(visit_status="unplanned")),
+            skipped=models.Count("id", filter=models.Q(visit_status="skipped")),
+            avg_rating=models.Avg("rating"),
+        )
+        # prefetch된 경우 COUNT(*) 없이 캐시 길이 사용
+        total_planned = len(trip.destinations.all())
+        planned_visited = agg["planned"]
+        unplanned_visited = agg["unplanned"]
+        skipped = agg["skipped"]
+        total_visited = planned_visited + unplanned_visited
+        avg_rating = agg["avg_rating"]
         
         return {
             "total_budget": trip.total_budget,
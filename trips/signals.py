@@ -0,0 +1,48 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from .models import Budget, Destination, Expense, Trip, TripLog
+
+
+def invalidate_trip_totals(sender, instance, **kwargs):
+    """예산/지출/여행지 변경 시 여행 합계 캐시를 무효화"""
+    cache.delete(f"trip:{instance.trip_id}:totals")
+
+
+for model in (Budget, Expense, Destination):
+    post_save.connect(invalidate_trip_totals, sender=model)
+    post_delete.connect(invalidate_trip_totals, sender=model)
+
+
+def touch_trip(sender, instance, **kwargs):
+    """자식 데이터 변경 시 Trip.updated_at 갱신
+
+    비교 응답 캐시처럼 updated_at을 키에 포함하는 캐시가 자동으로
+    무효화되도록 합니다.
+    """
+    Trip.objects.filter(pk=instance.trip_id).update(updated_at=timezone.now())
+
+
+for model in (Budget, Expense, Destination, TripLog):
+    post_save.connect(touch_trip, sender=model)
+    post_delete.connect(touch_trip, sender=model)
+
+
+def increment_destination_count(sender, instance, created, **kwargs):
+    """역정규화된 Trip.destination_count 유지 (F 표현식으로 경쟁 없이 증감)"""
+    if created:
+        Trip.objects.filter(pk=instance.trip_id).update(
+            destination_count=F("destination_count") + 1
+        )
+
+
+def decrement_destination_count(sender, instance, **kwargs):
+    Trip.objects.filter(pk=instance.trip_id).update(
+        destination_count=F("destination_count") - 1
+    )
+
+
+post_save.connect(increment_destination_count, sender=Destination)
+post_delete.connect(decrement_destination_count, sender=Destination)
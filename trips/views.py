@@ -1,10 +1,14 @@
+from collections import defaultdict
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, extend_schema_view
+from django.core.cache import cache
 from django.shortcuts import get_object_or_404
-from django.db.models import Sum, Avg
+from django.db.models import Avg, Count, F, Prefetch, Q, Sum
+from django.utils.timezone import localtime
 
 from trips.models import Trip, Destination, DayPlan, Budget, Expense, TripLog, BudgetCategory
 from trips.serializers import (
@@ -25,6 +29,12 @@ from trips.serializers import (
 from trips.permissions import IsOwnerOrReadOnly
 
 
+# 선택지 라벨은 모듈 로드 시 한 번만 dict로 구성 (행마다 get_*_display 호출 방지)
+_BUDGET_CATEGORY_LABELS = dict(BudgetCategory.choices)
+_PAYMENT_METHOD_LABELS = dict(Expense.PaymentMethod.choices)
+_DESTINATION_CATEGORY_LABELS = dict(Destination.Category.choices)
+
+
 @extend_schema_view(
     list=extend_schema(
         tags=["Trips"],
@@ -50,21 +60,66 @@ class TripViewSet(viewsets.ModelViewSet):
     
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        if not serializer.is_valid():
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
-        
-        trip = serializer.instance
-        response_serializer = TripDetailSerializer(trip)
+
+        response_serializer = TripDetailSerializer(
+            serializer.instance, context=self.get_serializer_context()
+        )
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
     
+    # 자식 자원 액션은 해당 관계만 직접 조회하므로 Trip 프리패치가 필요 없음
+    _CHILD_ACTIONS = frozenset([
+        "destinations", "add_destination", "days", "update_day",
+        "budgets", "set_budget", "expenses", "add_expense",
+        "logs", "add_log",
+    ])
+
     def get_queryset(self):
-        return Trip.objects.filter(user=self.request.user).prefetch_related(
-            "destinations", "day_plans", "budgets", "expenses", "logs"
-        )
+        queryset = Trip.objects.filter(user=self.request.user).select_related("user")
+        if self.action == "list":
+            # 목록은 헤더 컬럼 + 합계/기간/사용률 annotation + 여행지 이름만 필요
+            return (
+                queryset.with_stats()
+                .select_related("thumbnail_asset")
+                .prefetch_related(
+                    Prefetch(
+                        "destinations",
+                        queryset=Destination.objects.only("id", "trip_id", "name"),
+                    )
+                )
+                .for_list()
+            )
+        if self.action == "comparison":
+            return queryset.with_totals().prefetch_related(
+                Prefetch(
+                    "destinations",
+                    queryset=Destination.objects.only("id", "trip_id", "day", "name"),
+                ),
+                "day_plans",
+                Prefetch(
+                    "logs",
+                    queryset=TripLog.objects.select_related(None).only(
+                        "id", "trip_id", "day_number", "place_name", "visit_status"
+                    ),
+                ),
+            )
+        if self.action == "expense_summary":
+            return queryset.with_totals()
+        if self.action == "budget_summary":
+            # 합계는 cached_totals()가 캐시(미스 시 aggregate)로 공급하므로
+            # 서브쿼리 annotation을 붙이지 않음
+            return queryset
+        if self.action in self._CHILD_ACTIONS:
+            return queryset
+        return queryset.with_totals().full()
     
+    def get_object(self):
+        # 뷰 인스턴스는 요청마다 새로 만들어지므로 요청 내 재호출만 캐시됨
+        if not hasattr(self, "_cached_object"):
+            self._cached_object = super().get_object()
+        return self._cached_object
+
     def get_serializer_class(self):
         if self.action == "list":
             return TripListSerializer
@@ -82,18 +137,25 @@ class TripViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def destinations(self, request, pk=None):
         trip = self.get_object()
-        return Response(DestinationSerializer(trip.destinations.all(), many=True).data)
+        # 평면 목록은 serializer 기계를 거치지 않고 values()로 바로 직렬화
+        rows = list(trip.destinations.values(
+            "id", "name", "address", "latitude", "longitude", "day", "order",
+            "planned_time", "estimated_duration", "estimated_cost",
+            "category", "memo", "created_at",
+        ))
+        for row in rows:
+            row["category_display"] = _DESTINATION_CATEGORY_LABELS.get(row["category"], "")
+            # DB는 UTC로 반환하므로 serializer 경로와 같은 로컬 타임존으로 변환
+            row["created_at"] = localtime(row["created_at"])
+        return Response(rows)
     
     
     @extend_schema(tags=["Trips"], summary="여행지 추가", request=DestinationCreateSerializer, responses={201: DestinationSerializer})
     @destinations.mapping.post
     def add_destination(self, request, pk=None):
         trip = self.get_object()
-        serializer = DestinationCreateSerializer(data=request.data)
+        serializer = DestinationCreateSerializer(data=request.data, context={"trip": trip})
         if serializer.is_valid():
-            day = serializer.validated_data.get("day", 1)
-            if day > trip.duration_days:
-                return Response({"message": f"일차는 {trip.duration_days}일 이내여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
             destination = serializer.save(trip=trip)
             return Response(DestinationSerializer(destination).data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -106,7 +168,7 @@ class TripViewSet(viewsets.ModelViewSet):
         return Response(DayPlanSerializer(trip.day_plans.all(), many=True).data)
     
     @extend_schema(tags=["Trips"], summary="특정 일차 수정")
-    @action(detail=True, methods=["patch"], url_path="days/(?P<day_number>[0-9]+)")
+    @action(detail=True, methods=["patch"], url_path=r"days/(?P<day_number>\d+)")
     def update_day(self, request, pk=None, day_number=None):
         trip = self.get_object()
         day_plan = get_object_or_404(DayPlan, trip=trip, day_number=day_number)
@@ -121,7 +183,7 @@ class TripViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def budgets(self, request, pk=None):
         trip = self.get_object()
-        return Response(BudgetSerializer(trip.budgets.all(), many=True).data)
+        return Response(BudgetSerializer(trip.budgets_with_spent(), many=True).data)
     
     @extend_schema(tags=["Budget"], summary="예산 설정", request=BudgetCreateSerializer, responses={200: BudgetSerializer})
     @budgets.mapping.post
@@ -144,13 +206,18 @@ class TripViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"], url_path="budgets/summary")
     def budget_summary(self, request, pk=None):
         trip = self.get_object()
+        # 읽기가 잦은 요약은 GROUP BY 대신 캐시된 합계를 사용
+        # (자식 변경 시그널이 키를 무효화함)
+        totals = trip.cached_totals()
+        total_budget = totals["total_budget"]
+        total_expense = totals["total_expense"]
         return Response({
-            "total_budget": trip.total_budget,
-            "total_expense": trip.total_expense,
-            "total_estimated_cost": trip.total_estimated_cost,
-            "remaining": trip.budget_remaining,
-            "usage_percent": trip.budget_usage_percent,
-            "by_category": BudgetSerializer(trip.budgets.all(), many=True).data,
+            "total_budget": total_budget,
+            "total_expense": total_expense,
+            "total_estimated_cost": totals["total_estimated_cost"],
+            "remaining": total_budget - total_expense,
+            "usage_percent": round(total_expense / total_budget * 100, 1) if total_budget else 0,
+            "by_category": BudgetSerializer(trip.budgets_with_spent(), many=True).data,
         })
     
     
@@ -158,7 +225,22 @@ class TripViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def expenses(self, request, pk=None):
         trip = self.get_object()
-        return Response(ExpenseSerializer(trip.expenses.all(), many=True).data)
+        # 평면 목록은 serializer 기계를 거치지 않고 values()로 바로 직렬화
+        rows = list(trip.expenses.values(
+            "id", "category", "amount", "description", "expense_date",
+            "expense_time", "day_number", "destination", "payment_method",
+            "created_at", "updated_at",
+            destination_name=F("destination__name"),
+            receipt_image=F("receipt_image_asset__url"),
+        ))
+        for row in rows:
+            row["category_display"] = _BUDGET_CATEGORY_LABELS.get(row["category"], "")
+            row["payment_method_display"] = _PAYMENT_METHOD_LABELS.get(row["payment_method"], "")
+            row["receipt_image"] = row["receipt_image"] or ""
+            # DB는 UTC로 반환하므로 serializer 경로와 같은 로컬 타임존으로 변환
+            row["created_at"] = localtime(row["created_at"])
+            row["updated_at"] = localtime(row["updated_at"])
+        return Response(rows)
     
     @extend_schema(tags=["Expense"], summary="지출 추가", request=ExpenseCreateSerializer, responses={201: ExpenseSerializer})
     @expenses.mapping.post
@@ -167,6 +249,8 @@ class TripViewSet(viewsets.ModelViewSet):
         serializer = ExpenseCreateSerializer(data=request.data, context={"trip": trip})
         if serializer.is_valid():
             expense = serializer.save(trip=trip)
+            # 단건 응답은 annotation 경로를 타지 않으므로 평탄화 속성을 직접 채움
+            expense.destination_name = expense.destination.name if expense.destination_id else None
             return Response(ExpenseSerializer(expense).data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
@@ -174,22 +258,21 @@ class TripViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"], url_path="expenses/summary")
     def expense_summary(self, request, pk=None):
         trip = self.get_object()
+        # 전체 행을 끌어와 파이썬으로 합산하는 대신 GROUP BY 세 번으로 집계
         expenses = trip.expenses.all()
-        
-        by_category = {}
-        by_day = {}
-        by_payment = {}
-        
-        for exp in expenses:
-            cat = exp.get_category_display()
-            by_category[cat] = by_category.get(cat, 0) + float(exp.amount)
-            
-            day = f"Day {exp.day_number}" if exp.day_number else "미분류"
-            by_day[day] = by_day.get(day, 0) + float(exp.amount)
-            
-            method = exp.get_payment_method_display()
-            by_payment[method] = by_payment.get(method, 0) + float(exp.amount)
-        
+        by_category = {
+            _BUDGET_CATEGORY_LABELS.get(r["category"], r["category"]): float(r["total"])
+            for r in expenses.values("category").annotate(total=Sum("amount")).order_by()
+        }
+        by_day = {
+            (f"Day {r['day_number']}" if r["day_number"] else "미분류"): float(r["total"])
+            for r in expenses.values("day_number").annotate(total=Sum("amount")).order_by()
+        }
+        by_payment = {
+            _PAYMENT_METHOD_LABELS.get(r["payment_method"], r["payment_method"]): float(r["total"])
+            for r in expenses.values("payment_method").annotate(total=Sum("amount")).order_by()
+        }
+
         return Response({
             "total": trip.total_expense,
             "by_category": by_category,
@@ -202,7 +285,8 @@ class TripViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def logs(self, request, pk=None):
         trip = self.get_object()
-        return Response(TripLogSerializer(trip.logs.all(), many=True).data)
+        logs = TripLogSerializer.setup_eager_loading(trip.logs.all())
+        return Response(TripLogSerializer(logs, many=True).data)
     
     @extend_schema(tags=["TripLog"], summary="여행 기록 추가", request=TripLogCreateSerializer, responses={201: TripLogSerializer})
     @logs.mapping.post
@@ -211,6 +295,8 @@ class TripViewSet(viewsets.ModelViewSet):
         serializer = TripLogCreateSerializer(data=request.data)
         if serializer.is_valid():
             log = serializer.save(trip=trip)
+            # 단건 응답은 annotation 경로를 타지 않으므로 평탄화 속성을 직접 채움
+            log.destination_name = log.destination.name if log.destination_id else None
             return Response(TripLogSerializer(log).data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
@@ -223,29 +309,51 @@ class TripViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["get"])
     def comparison(self, request, pk=None):
         trip = self.get_object()
-        
-        # 예산 비교
+
+        # 자식 데이터 변경 시그널이 updated_at을 갱신하므로 키가 자동 회전됨
+        cache_key = f"trip-cmp:{trip.pk}:{trip.updated_at.timestamp()}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached)
+
+        # 예산 비교: 카테고리별 2회 쿼리 대신 GROUP BY 두 번으로 집계
+        budgets_map = {
+            b["category"]: b["amount"]
+            for b in trip.budgets.values("category").annotate(amount=Sum("amount")).order_by()
+        }
+        exp_map = {
+            e["category"]: e["total"]
+            for e in trip.expenses.values("category").annotate(total=Sum("amount")).order_by()
+        }
         budget_comparison = []
         for category, label in BudgetCategory.choices:
-            budget = trip.budgets.filter(category=category).first()
-            budget_amount = budget.amount if budget else 0
-            expense_total = trip.expenses.filter(category=category).aggregate(total=Sum("amount"))["total"] or 0
-            
+            budget_amount = budgets_map.get(category, 0)
+            expense_total = exp_map.get(category, 0)
+
+            # 금액 컬럼이 정수이므로 캐스팅 없이 정수 연산 후 한 번만 나눗셈
             budget_comparison.append({
                 "category": category,
                 "category_display": label,
                 "budget": float(budget_amount),
                 "actual": float(expense_total),
                 "difference": float(budget_amount - expense_total),
-                "usage_percent": round(float(expense_total) / float(budget_amount) * 100, 1) if budget_amount > 0 else 0,
+                "usage_percent": round(expense_total * 100 / budget_amount, 1) if budget_amount > 0 else 0,
             })
         
-        # 일정 비교
+        # 일정 비교: prefetch 캐시를 일차별로 한 번만 버킷팅 (일차당 쿼리 제거)
+        planned_by_day = defaultdict(set)
+        for dest in trip.destinations.all():
+            planned_by_day[dest.day].add(dest.name)
+        actual_by_day = defaultdict(set)
+        for log in trip.logs.all():
+            if log.visit_status in ("planned", "unplanned"):
+                actual_by_day[log.day_number].add(log.place_name)
+
         schedule_comparison = []
         for day_plan in trip.day_plans.all():
-            planned = set(trip.destinations.filter(day=day_plan.day_number).values_list("name", flat=True))
-            actual_visited = set(trip.logs.filter(day_number=day_plan.day_number, visit_status__in=["planned", "unplanned"]).values_list("place_name", flat=True))
-            
+            planned = planned_by_day[day_plan.day_number]
+            actual_visited = actual_by_day[day_plan.day_number]
+
             schedule_comparison.append({
                 "day_number": day_plan.day_number,
                 "date": day_plan.date,
@@ -258,19 +366,29 @@ class TripViewSet(viewsets.ModelViewSet):
                 "unplanned_visits": list(actual_visited - planned),
             })
         
-        # 전체 요약
-        total_planned = trip.destinations.count()
-        planned_visited = trip.logs.filter(visit_status="planned").count()
-        unplanned_visited = trip.logs.filter(visit_status="unplanned").count()
-        avg_rating = trip.logs.filter(rating__isnull=False).aggregate(avg=Avg("rating"))["avg"]
-        
+        # 전체 요약: 방문 상태별 count와 평점 평균을 조건부 집계 한 번으로 조회
+        log_stats = trip.logs.aggregate(
+            planned=Count("id", filter=Q(visit_status="planned")),
+            unplanned=Count("id", filter=Q(visit_status="unplanned")),
+            avg_rating=Avg("rating"),
+        )
+        total_planned = len(trip.destinations.all())  # 뷰셋 prefetch 캐시 재사용
+        planned_visited = log_stats["planned"]
+        unplanned_visited = log_stats["unplanned"]
+        avg_rating = log_stats["avg_rating"]
+
+        # 합계는 with_totals() annotation이 캐시하므로 한 번만 읽어 재사용
+        total_budget = float(trip.total_budget)
+        total_expense = float(trip.total_expense)
+        total_estimated = float(trip.total_estimated_cost)
+
         summary = {
-            "total_budget": float(trip.total_budget),
-            "total_expense": float(trip.total_expense),
-            "budget_remaining": float(trip.budget_remaining),
+            "total_budget": total_budget,
+            "total_expense": total_expense,
+            "budget_remaining": total_budget - total_expense,
             "budget_usage_percent": trip.budget_usage_percent,
-            "total_estimated_cost": float(trip.total_estimated_cost),
-            "estimated_vs_actual_diff": float(trip.total_estimated_cost - trip.total_expense),
+            "total_estimated_cost": total_estimated,
+            "estimated_vs_actual_diff": total_estimated - total_expense,
             "total_planned_places": total_planned,
             "total_visited_places": planned_visited + unplanned_visited,
             "planned_and_visited": planned_visited,
@@ -279,11 +397,13 @@ class TripViewSet(viewsets.ModelViewSet):
             "average_rating": round(avg_rating, 1) if avg_rating else None,
         }
         
-        return Response({
+        payload = {
             "budget_comparison": budget_comparison,
             "schedule_comparison": schedule_comparison,
             "summary": summary,
-        })
+        }
+        cache.set(cache_key, payload, timeout=3600)
+        return Response(payload)
 
 
 # 개별 리소스 ViewSet 
@@ -301,7 +421,10 @@ class DestinationViewSet(viewsets.ModelViewSet):
     http_method_names = ["get", "put", "patch", "delete"]
     
     def get_queryset(self):
-        return Destination.objects.filter(trip__user=self.request.user)
+        # 권한 검사의 obj.trip.user 접근이 추가 쿼리를 내지 않도록 JOIN으로 로드
+        return Destination.objects.filter(trip__user=self.request.user).select_related(
+            "trip", "trip__user"
+        )
 
 
 @extend_schema_view(
@@ -317,7 +440,13 @@ class ExpenseViewSet(viewsets.ModelViewSet):
     http_method_names = ["get", "put", "patch", "delete"]
     
     def get_queryset(self):
-        return Expense.objects.filter(trip__user=self.request.user)
+        # 기본 매니저가 trip을 select_related하므로 소유자 검사용 user만 추가.
+        # destination_name annotation은 serializer의 eager-loading 헬퍼가 담당
+        return ExpenseSerializer.setup_eager_loading(
+            Expense.objects.filter(trip__user=self.request.user).select_related(
+                "trip__user"
+            )
+        )
 
 
 @extend_schema_view(
@@ -333,4 +462,10 @@ class TripLogViewSet(viewsets.ModelViewSet):
     http_method_names = ["get", "put", "patch", "delete"]
     
     def get_queryset(self):
-        return TripLog.objects.filter(trip__user=self.request.user)
+        # 기본 매니저가 trip을 select_related하므로 소유자 검사용 user만 추가.
+        # destination_name annotation은 serializer의 eager-loading 헬퍼가 담당
+        return TripLogSerializer.setup_eager_loading(
+            TripLog.objects.filter(trip__user=self.request.user).select_related(
+                "trip__user"
+            )
+        )
@@ -42,15 +42,7 @@ class SocialAccountAdmin(admin.ModelAdmin):
         "id",
         "user",
         "provider",
-        "provider_user_id_masked",
+        "masked_id",
     )
     list_filter = ("provider",)
-    search_fields = ("user__email", "user__nickname")
-    
-    def provider_user_id_masked(self, obj):
-        """소셜 ID 마스킹"""
-        pid = obj.provider_user_id
-        if len(pid) > 8:
-            return f"{pid[:4]}...{pid[-4:]}"
-        return pid
-    provider_user_id_masked.short_description = "소셜 ID"
\ No newline at end of file
+    search_fields = ("user__email", "user__nickname", "masked_id")
\ No newline at end of file
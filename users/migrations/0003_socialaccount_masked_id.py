@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:05
+
+from django.db import migrations, models
+
+
+def backfill_masked_id(apps, schema_editor):
+    SocialAccount = apps.get_model('users', 'SocialAccount')
+    accounts = []
+    for account in SocialAccount.objects.all().iterator():
+        pid = account.provider_user_id
+        account.masked_id = f"{pid[:4]}...{pid[-4:]}" if len(pid) > 8 else pid
+        accounts.append(account)
+    SocialAccount.objects.bulk_update(accounts, ['masked_id'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_user_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='socialaccount',
+            name='masked_id',
+            field=models.CharField(db_index=True, default='', editable=False, help_text='목록 표시·검색용으로 마스킹된 소셜 ID (저장 시 자동 생성)', max_length=20, verbose_name='소셜 ID'),
+        ),
+        migrations.RunPython(backfill_masked_id, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_socialaccount_masked_id'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='socialaccount',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='socialaccount',
+            constraint=models.UniqueConstraint(fields=('provider', 'provider_user_id'), name='uniq_social_provider_uid'),
+        ),
+    ]
@@ -28,7 +28,15 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def __str__(self):
         return f"{self.nickname} ({self.email})"
-    
+
+    def serialized_cache_key(self):
+        """프로필 응답 캐시 키 — updated_at이 갱신되면 자동으로 회전됩니다.
+
+        초 단위로 버리면 같은 초 안의 수정이 키를 회전시키지 못하므로
+        마이크로초까지 포함한 전체 타임스탬프를 사용합니다.
+        """
+        return f"user:ser:{self.pk}:{self.updated_at.timestamp()}"
+
     def has_perm(self, perm, obj = ...):
         return super().has_perm(perm, obj)
     
@@ -44,9 +52,33 @@ class SocialAccount(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='social_accounts')
     provider = models.CharField(max_length=20, choices=Providers.choices)
     provider_user_id = models.CharField(max_length=255, help_text="카카오_oid, 구글_sub 등 소셜 서비스 고유 ID")
+    masked_id = models.CharField(
+        "소셜 ID",
+        max_length=20,
+        default="",
+        editable=False,
+        db_index=True,
+        help_text="목록 표시·검색용으로 마스킹된 소셜 ID (저장 시 자동 생성)",
+    )
 
     class Meta:
-        unique_together = ('provider', 'provider_user_id')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['provider', 'provider_user_id'],
+                name='uniq_social_provider_uid',
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.provider} - {self.provider_user_id}"
\ No newline at end of file
+        return f"{self.provider} - {self.provider_user_id}"
+
+    @staticmethod
+    def mask_provider_user_id(pid):
+        """소셜 ID 마스킹 (앞뒤 4자만 노출)"""
+        if len(pid) > 8:
+            return f"{pid[:4]}...{pid[-4:]}"
+        return pid
+
+    def save(self, *args, **kwargs):
+        self.masked_id = self.mask_provider_user_id(self.provider_user_id)
+        super().save(*args, **kwargs)
\ No newline at end of file
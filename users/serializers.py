@@ -3,7 +3,19 @@ from users.models import User
 
 
 class SocialLoginRequestSerializer(serializers.Serializer):
-    code = serializers.CharField(help_text="OAuth 인가 코드 (authorization code)")
+    code = serializers.CharField(
+        required=False, help_text="OAuth 인가 코드 (authorization code)"
+    )
+    access_token = serializers.CharField(
+        required=False, help_text="IdP 엑세스 토큰 (모바일 SDK 사용 시)"
+    )
+
+    def validate(self, attrs):
+        if not attrs.get("code") and not attrs.get("access_token"):
+            raise serializers.ValidationError(
+                {"message": "code 또는 access_token을 제공해야 합니다."}
+            )
+        return attrs
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -26,17 +38,15 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             "nickname",
             "profile_image",
         )
-        
+        # 중복 검사는 DB unique 제약에 맡기고 뷰에서 IntegrityError를 처리
+        # (사전 SELECT는 동시 수정 시 경쟁 조건이 있고 성공 경로에도 쿼리를 추가)
+        extra_kwargs = {"nickname": {"validators": []}}
+
     def validate_nickname(self, value):
         if len(value) < 2:
             raise serializers.ValidationError("닉네임은 최소 2자 이상이어야 합니다.")
         if len(value) > 22:
             raise serializers.ValidationError("닉네임은 최대 22자 이하여야 합니다.")
-        
-        user = self.instance
-        if User.objects.exclude(id=user.id).filter(nickname=value).exists():
-            raise serializers.ValidationError("이미 사용 중인 닉네임입니다.")
-        
         return value
 
 
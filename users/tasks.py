@@ -0,0 +1,70 @@
+import logging
+
+import requests
+from celery import shared_task
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def blacklist_refresh_token(refresh_token):
+    """로그아웃된 refresh 토큰의 블랙리스트 등록을 워커에서 수행
+
+    뷰는 서명·만료 검증만 하고 바로 응답하며, DB 쓰기는 여기서
+    처리됩니다.
+    """
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    try:
+        RefreshToken(refresh_token).blacklist()
+    except Exception as e:
+        logger.error("Error blacklisting token: %s", str(e))
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(requests.ConnectionError, requests.Timeout, requests.HTTPError),
+    retry_backoff=True,
+    max_retries=5,
+)
+def unlink_social_account(self, provider, provider_user_id):
+    """소셜 계정 연결 해제를 워커에서 수행
+
+    탈퇴 응답이 IdP 왕복 지연에 막히지 않도록 provider 식별자만 받아
+    백그라운드에서 호출합니다. 호출 시점에는 계정 행이 이미 삭제되어
+    있을 수 있으므로 모델 인스턴스를 넘기지 않습니다. 네트워크 오류와
+    5xx 응답만 지수 백오프로 최대 5회 재시도하고, 4xx(이미 해제된
+    계정 등)는 영구 실패로 보고 재시도하지 않습니다.
+    """
+    # 순환 임포트 방지를 위해 함수 내부에서 임포트
+    from users.models import SocialAccount
+    from users.views import _REQUEST_TIMEOUT, _SESSION
+
+    if provider == SocialAccount.Providers.KAKAO:
+        admin_key = getattr(settings, "KAKAO_ADMIN_KEY", None)
+        if admin_key:
+            res = _SESSION.post(
+                "https://kapi.kakao.com/v1/user/unlink",
+                headers={"Authorization": f"KakaoAK {admin_key}"},
+                data={
+                    "target_id_type": "user_id",
+                    "target_id": provider_user_id,
+                },
+                timeout=_REQUEST_TIMEOUT,
+            )
+            if res.status_code >= 500:
+                # HTTPError는 autoretry 대상 — 일시적 서버 오류만 여기로 옴
+                res.raise_for_status()
+            if res.status_code >= 400:
+                logger.warning(
+                    "Kakao unlink rejected (%s) for user %s",
+                    res.status_code,
+                    provider_user_id,
+                )
+            else:
+                logger.info(f"Kakao account unlinked for user {provider_user_id}")
+    elif provider == SocialAccount.Providers.GOOGLE:
+        logger.info(
+            f"Google account unlinking not implemented for user {provider_user_id}"
+        )
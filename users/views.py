@@ -1,7 +1,17 @@
 # accounts/views.py
-import requests
+import hashlib
 import logging
+
+import jwt
+import orjson
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils.timezone import localtime
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -11,6 +21,7 @@ from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, Ou
 from drf_spectacular.utils import extend_schema, OpenApiExample
 
 from users.models import User, SocialAccount
+from users.tasks import blacklist_refresh_token, unlink_social_account
 from users.serializers import (
     SocialLoginRequestSerializer,
     SocialLoginResponseSerializer,
@@ -23,6 +34,94 @@ from users.serializers import (
 
 logger = logging.getLogger(__name__)
 
+# 고정된 OAuth 호스트(kauth/kapi/구글)에 keep-alive 연결을 재사용하기 위한
+# 모듈 수준 세션 — 호출마다 TCP+TLS 핸드셰이크를 새로 맺지 않습니다.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ),
+)
+# (connect, read) 타임아웃 — 외부 IdP 지연이 요청을 무한정 붙잡지 않도록
+_REQUEST_TIMEOUT = (3, 5)
+
+# 같은 액세스 토큰으로 반복 로그인할 때 userinfo 원격 호출을 생략하는 TTL
+_USERINFO_CACHE_TTL = 300
+
+# 토큰 교환이 진행되는 동안 userinfo 호스트의 TLS 연결을 미리 맺어 두는 용도
+_WARMUP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="oauth-warmup")
+
+
+def _warm_up_connection(base_url):
+    """userinfo 호출은 토큰 교환 결과에 의존하므로 병렬화할 수 없지만,
+    그 사이에 다음 호스트로의 핸드셰이크를 끝내 두면 keep-alive 풀에서
+    바로 재사용됩니다. 실패해도 본 호출에는 영향이 없습니다."""
+    try:
+        _SESSION.head(base_url, timeout=_REQUEST_TIMEOUT)
+    except requests.RequestException:
+        pass
+
+
+def _serialized_user(user):
+    """UserSerializer 결과를 updated_at 기반 키로 단기 캐시
+
+    프로필 수정 시 updated_at이 갱신되며 키가 회전되므로 별도 무효화가
+    필요 없습니다.
+    """
+    return cache.get_or_set(
+        user.serialized_cache_key(), lambda: UserSerializer(user).data, 60
+    )
+
+
+def _user_payload(user):
+    """로그인 응답에 삽입되는 작고 고정된 user dict는 serializer를 생략
+
+    UserSerializer와 동일한 키와 표현을 유지합니다 — DRF DateTimeField처럼
+    현재 타임존(Asia/Seoul)으로 변환한 ISO-8601 문자열을 씁니다. 프로필
+    조회/수정 응답은 계속 serializer를 사용합니다.
+    """
+    created_at = localtime(user.created_at).isoformat()
+    if created_at.endswith("+00:00"):
+        created_at = created_at[:-6] + "Z"
+    return {
+        "id": user.id,
+        "email": user.email,
+        "nickname": user.nickname,
+        "profile_image": user.profile_image,
+        "created_at": created_at,
+    }
+
+
+def _claims_from_id_token(id_token):
+    """구글 token 응답에 포함된 id_token에서 프로필 클레임을 추출
+
+    id_token은 TLS로 보호된 토큰 엔드포인트에서 직접 받은 것이므로
+    서명 재검증 없이 사용할 수 있습니다(OIDC Core 3.1.3.7). aud/iss와
+    필수 클레임만 확인하고, 조건을 만족하지 않으면 None을 반환해
+    기존 userinfo 호출 경로로 폴백합니다.
+    """
+    try:
+        claims = jwt.decode(id_token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        return None
+
+    if claims.get("aud") != settings.GOOGLE_CLIENT_ID:
+        return None
+    if claims.get("iss") not in ("https://accounts.google.com", "accounts.google.com"):
+        return None
+    if not claims.get("sub") or not claims.get("email"):
+        return None
+    return claims
+
+
+def _userinfo_cache_key(provider, access_token):
+    """토큰 원문 대신 해시를 키로 사용 (캐시에 토큰이 남지 않도록)"""
+    digest = hashlib.sha256(access_token.encode()).hexdigest()
+    return f"oidc:userinfo:{provider}:{digest}"
+
 
 class KakaoLoginAPIView(APIView):
     permission_classes = [AllowAny]
@@ -60,23 +159,20 @@ class KakaoLoginAPIView(APIView):
         ],
     )
     def post(self, request, *args, **kwargs):
-        code = request.data.get("code")
-        access_token = request.data.get("access_token")
-        
+        serializer = SocialLoginRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        code = serializer.validated_data.get("code")
+        access_token = serializer.validated_data.get("access_token")
+
         if access_token:
             return self._login_with_access_token(access_token)
-        
-        if code:
-            return self._login_with_code(code)
-        
-        return Response(
-            {"messsage": "code 또는 access_token을 제공해야 합니다."},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
+
+        return self._login_with_code(code)
     
     def _login_with_code(self, code):
         """카카오 인가 코드로 로그인 처리"""
-        token_res = requests.post(
+        _WARMUP_EXECUTOR.submit(_warm_up_connection, "https://kapi.kakao.com")
+        token_res = _SESSION.post(
             "https://kauth.kakao.com/oauth/token",
             data={
                 "grant_type": "authorization_code",
@@ -85,6 +181,7 @@ class KakaoLoginAPIView(APIView):
                 "redirect_uri": settings.KAKAO_REDIRECT_URI,
                 "code": code,
             },
+            timeout=_REQUEST_TIMEOUT,
         )
         
         logger.info(f"Kakao token response status: {token_res.status_code}")
@@ -95,24 +192,29 @@ class KakaoLoginAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        access_token = token_res.json().get("access_token")
+        access_token = orjson.loads(token_res.content).get("access_token")
         return self._login_with_access_token(access_token)
     
     
     def _login_with_access_token(self, access_token):
         """카카오 엑세스 토큰으로 로그인 처리"""
-        headers = {"Authorization": f"Bearer {access_token}"}
-        profile_res = requests.get(
-            "https://kapi.kakao.com/v2/user/me", headers=headers
-        )
-
-        if profile_res.status_code != 200:
-            return Response(
-                {"detail": "Failed to obtain user information from Kakao"},
-                status=status.HTTP_400_BAD_REQUEST,
+        # 같은 토큰 재사용 로그인(모바일 SDK의 토큰 재전송)은 IdP 왕복 생략
+        cache_key = _userinfo_cache_key("kakao", access_token)
+        profile_json = cache.get(cache_key)
+        if profile_json is None:
+            headers = {"Authorization": f"Bearer {access_token}"}
+            profile_res = _SESSION.get(
+                "https://kapi.kakao.com/v2/user/me", headers=headers, timeout=_REQUEST_TIMEOUT
             )
 
-        profile_json = profile_res.json()
+            if profile_res.status_code != 200:
+                return Response(
+                    {"detail": "Failed to obtain user information from Kakao"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            profile_json = orjson.loads(profile_res.content)
+            cache.set(cache_key, profile_json, timeout=_USERINFO_CACHE_TTL)
         kakao_oid = str(profile_json["id"])
         properties = profile_json.get("properties", {})
         kakao_account = profile_json.get("kakao_account", {})
@@ -123,7 +225,7 @@ class KakaoLoginAPIView(APIView):
 
         # SocialAccount & User 연결
         try:
-            social = SocialAccount.objects.get(
+            social = SocialAccount.objects.select_related("user").get(
                 provider=SocialAccount.Providers.KAKAO,
                 provider_user_id=kakao_oid,
             )
@@ -132,26 +234,36 @@ class KakaoLoginAPIView(APIView):
         except SocialAccount.DoesNotExist:
             if not email:
                 email = f"kakao_{kakao_oid}@tripnote.local"
-                
-            user, created = User.objects.get_or_create(
-                email=email,
-                defaults={
-                    "nickname": nickname,
-                    "profile_image": profile_image,
-                },
-            )
-            SocialAccount.objects.create(
-                user=user,
-                provider=SocialAccount.Providers.KAKAO,
-                provider_user_id=kakao_oid,
-            )
+
+            try:
+                with transaction.atomic():
+                    user, created = User.objects.get_or_create(
+                        email=email,
+                        defaults={
+                            "nickname": nickname,
+                            "profile_image": profile_image,
+                        },
+                    )
+                    SocialAccount.objects.create(
+                        user=user,
+                        provider=SocialAccount.Providers.KAKAO,
+                        provider_user_id=kakao_oid,
+                    )
+            except IntegrityError:
+                # 동시 로그인으로 다른 요청이 먼저 생성한 경우 그 행을 재사용
+                social = SocialAccount.objects.select_related("user").get(
+                    provider=SocialAccount.Providers.KAKAO,
+                    provider_user_id=kakao_oid,
+                )
+                user = social.user
+                created = False
 
         refresh = RefreshToken.for_user(user)
 
         response_data = {
             "access_token": str(refresh.access_token),
             "refresh_token": str(refresh),
-            "user": UserSerializer(user).data,
+            "user": _user_payload(user),
             "is_created": created,
         }
 
@@ -178,9 +290,17 @@ class GoogleLoginAPIView(APIView):
     def post(self, request, *args, **kwargs):
         serializer = SocialLoginRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        code = serializer.validated_data["code"]
-        
-        token_res = requests.post(
+        code = serializer.validated_data.get("code")
+
+        # 구글은 인가 코드 방식만 지원
+        if not code:
+            return Response(
+                {"message": "code를 제공해야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        _WARMUP_EXECUTOR.submit(_warm_up_connection, "https://openidconnect.googleapis.com")
+        token_res = _SESSION.post(
             "https://oauth2.googleapis.com/token",
             data={
                 "grant_type": "authorization_code",
@@ -189,6 +309,7 @@ class GoogleLoginAPIView(APIView):
                 "redirect_uri": settings.GOOGLE_REDIRECT_URI,
                 "code": code
             },
+            timeout=_REQUEST_TIMEOUT,
         )
         
         logger.info(f"Google token response status: {token_res.status_code}")
@@ -199,7 +320,7 @@ class GoogleLoginAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        token_json = token_res.json()
+        token_json = orjson.loads(token_res.content)
         access_token = token_json.get("access_token")
         
         if not access_token:
@@ -208,20 +329,32 @@ class GoogleLoginAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        headers = {"Authorization": f"Bearer {access_token}"}
-        profile_res = requests.get(
-            "https://openidconnect.googleapis.com/v1/userinfo",
-            headers=headers,
-        )
-        
-        if profile_res.status_code != 200:
-            return Response(
-                {"detail": "Google access token not found in response"},
-                status=status.HTTP_400_BAD_REQUEST,
+        # token 응답의 id_token에 sub/email/name/picture가 이미 들어 있으므로
+        # 추출에 성공하면 userinfo 왕복 자체를 생략 (로그인당 외부 호출 1회)
+        id_token = token_json.get("id_token")
+        profile_json = _claims_from_id_token(id_token) if id_token else None
+
+        if profile_json is None:
+            # 같은 토큰 재사용 로그인은 IdP 왕복 생략
+            cache_key = _userinfo_cache_key("google", access_token)
+            profile_json = cache.get(cache_key)
+        if profile_json is None:
+            headers = {"Authorization": f"Bearer {access_token}"}
+            profile_res = _SESSION.get(
+                "https://openidconnect.googleapis.com/v1/userinfo",
+                headers=headers,
+                timeout=_REQUEST_TIMEOUT,
             )
-            
-        profile_json = profile_res.json()
-        
+
+            if profile_res.status_code != 200:
+                return Response(
+                    {"detail": "Google access token not found in response"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            profile_json = orjson.loads(profile_res.content)
+            cache.set(cache_key, profile_json, timeout=_USERINFO_CACHE_TTL)
+
         google_oid = profile_json.get("sub")
         email = profile_json.get("email")
         name = profile_json.get("name") or email.split("@")[0] if email else "사용자"
@@ -234,37 +367,42 @@ class GoogleLoginAPIView(APIView):
             )
         
         try:
-            social = SocialAccount.objects.get(
+            social = SocialAccount.objects.select_related("user").get(
                 provider=SocialAccount.Providers.GOOGLE,
                 provider_user_id=google_oid,
             )
             user = social.user
             created = False
         except SocialAccount.DoesNotExist:
-            user = User.objects.filter(email=email).first()
-            
-            if user is None:
-                user = User.objects.create(
-                    email=email,
-                    nickname=name,
-                    profile_image=picture,
+            try:
+                with transaction.atomic():
+                    user, created = User.objects.get_or_create(
+                        email=email,
+                        defaults={
+                            "nickname": name,
+                            "profile_image": picture,
+                        },
+                    )
+                    SocialAccount.objects.create(
+                        user=user,
+                        provider=SocialAccount.Providers.GOOGLE,
+                        provider_user_id=google_oid,
+                    )
+            except IntegrityError:
+                # 동시 로그인으로 다른 요청이 먼저 생성한 경우 그 행을 재사용
+                social = SocialAccount.objects.select_related("user").get(
+                    provider=SocialAccount.Providers.GOOGLE,
+                    provider_user_id=google_oid,
                 )
-                created = True
-            else:
+                user = social.user
                 created = False
-                
-            SocialAccount.objects.create(
-                user=user,
-                provider=SocialAccount.Providers.GOOGLE,
-                provider_user_id=google_oid,
-            )
         
         refresh = RefreshToken.for_user(user)
         
         response_data = {
             "access_token" : str(refresh.access_token),
             "refresh_token" : str(refresh),
-            "user": UserSerializer(user).data,
+            "user": _user_payload(user),
             "is_created": created,
         }
         
@@ -300,9 +438,10 @@ class LogoutAPIView(APIView):
         
         try:
             refresh_token = serializer.validated_data["refresh_token"]
-            token = RefreshToken(refresh_token)
-            token.blacklist()
-            
+            # 서명·만료 검증만 요청 내에서 수행하고 DB 쓰기는 워커로 위임
+            RefreshToken(refresh_token)
+            blacklist_refresh_token.delay(refresh_token)
+
             return Response(
                 {"message": "로그아웃 되었습니다."},
                 status=status.HTTP_200_OK,
@@ -342,11 +481,15 @@ class WithdrawalAPIView(APIView):
         refresh_token = serializer.validated_data.get("refresh")
         
         try:
-            social_accounts = SocialAccount.objects.filter(user=user)
-            
-            for social in social_accounts:
-                self._unlink_social_account(social)
-                
+            # IdP 연결 해제는 워커로 넘기고, 계정 행은 user.delete()의
+            # CASCADE로 함께 삭제됨 — 응답이 외부 RTT에 막히지 않음
+            social_accounts = SocialAccount.objects.filter(user=user).values_list(
+                "provider", "provider_user_id"
+            )
+            for provider, provider_user_id in social_accounts:
+                unlink_social_account.delay(provider, provider_user_id)
+
+
             if refresh_token:
                 try:
                     token = RefreshToken(refresh_token)
@@ -354,13 +497,16 @@ class WithdrawalAPIView(APIView):
                 except Exception as e:
                     pass
             
-            outstanding_tokens = OutstandingToken.objects.filter(user=user)
-            for o_token in outstanding_tokens:
-                try:
-                    BlacklistedToken.objects.get_or_create(token=o_token)
-                except Exception as e:
-                    pass
-                
+            # 토큰별 get_or_create 루프(2N 쿼리) 대신 단일 배치 INSERT
+            outstanding_ids = OutstandingToken.objects.filter(user=user).values_list(
+                "id", flat=True
+            )
+            BlacklistedToken.objects.bulk_create(
+                [BlacklistedToken(token_id=token_id) for token_id in outstanding_ids],
+                ignore_conflicts=True,
+            )
+
+
             user.delete()
             
             return Response(
@@ -375,37 +521,6 @@ class WithdrawalAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
     
-    def _unlink_social_account(self, social: SocialAccount):
-        try:
-            if social.provider == SocialAccount.Providers.KAKAO:
-                self._unlink_kakao(social)
-            elif social.provider == SocialAccount.Providers.GOOGLE:
-                self._unlink_google(social)
-        except Exception as e:
-            logger.error(f"Error unlinking social account {social.provider}: {str(e)}")
-        finally:
-            social.delete()
-            
-    def _unlink_kakao(self, social: SocialAccount):
-        admin_key = getattr(settings, "KAKAO_ADMIN_KEY", None)
-        
-        if admin_key:
-            requests.post(
-                "https://kapi.kakao.com/v1/user/unlink",
-                headers={
-                    "Authorization": f"KakaoAK {admin_key}"
-                },
-                data={
-                    "target_id_type": "user_id",
-                    "target_id": social.provider_user_id,
-                }
-            )
-            logger.info(f"Kakao account unlinked for user {social.provider_user_id}")
-            
-            
-    def _unlink_google(self, social: SocialAccount):
-        logger.info(f"Google account unlinking not implemented for user {social.provider_user_id}")
-        
 
 class UserProfileAPIView(APIView):
     permission_classes = [IsAuthenticated]
@@ -421,8 +536,7 @@ class UserProfileAPIView(APIView):
     )
     
     def get(self, request):
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(_serialized_user(request.user), status=status.HTTP_200_OK)
     
     @extend_schema(
         tags=["User - Profile"],
@@ -438,12 +552,22 @@ class UserProfileAPIView(APIView):
         serializer = UserUpdateSerializer(request.user, data=request.data, partial=True)
         
         if serializer.is_valid():
-            serializer.save()
+            try:
+                serializer.save()
+            except IntegrityError:
+                # 닉네임 중복은 사전 SELECT 대신 DB unique 제약으로 검출
+                return Response(
+                    {
+                        "message": "프로필 수정에 실패했습니다.",
+                        "errors": {"nickname": ["이미 사용 중인 닉네임입니다."]},
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response(
-                UserSerializer(request.user).data,
+                _serialized_user(request.user),
                 status=status.HTTP_200_OK,
             )
-        
+
         return Response(
             {"message": "프로필 수정에 실패했습니다.", "errors": serializer.errors},
             status=status.HTTP_400_BAD_REQUEST,
@@ -476,16 +600,19 @@ class SocialAccountsAPIView(APIView):
         },
     )
     def get(self, request):
-        social_accounts = SocialAccount.objects.filter(user=request.user)
-        
+        # 두 컬럼만 읽으므로 모델 인스턴스化 없이 raw 튜플로 직렬화
+        rows = SocialAccount.objects.filter(user=request.user).values_list(
+            "provider", "provider_user_id"
+        )
+
         data = {
             "social_accounts": [
                 {
-                    "provider": sa.provider,
-                    "provider_user_id": sa.provider_user_id[-4:].rjust(len(sa.provider_user_id), '*'),  # 마스킹
+                    "provider": provider,
+                    "provider_user_id": pid[-4:].rjust(len(pid), '*'),  # 마스킹
                 }
-                for sa in social_accounts
+                for provider, pid in rows
             ]
         }
-        
+
         return Response(data, status=status.HTTP_200_OK)
\ No newline at end of file